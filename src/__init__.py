@@ -1,7 +0,0 @@
-"""
-Web Crawler Package
-
-A powerful, flexible, and robust web crawler for extracting data from websites.
-"""
-
-__version__ = '1.0.0' 
\ No newline at end of file
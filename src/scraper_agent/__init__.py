@@ -0,0 +1,39 @@
+"""
+Web Crawler Package
+
+A powerful, flexible, and robust web crawler for extracting data from websites.
+"""
+
+import importlib
+from typing import Any, List
+
+try:
+    # Generated by setuptools_scm from git metadata at build time
+    from ._version import __version__
+except ImportError:  # source checkout that has not been built/installed
+    __version__ = '0.0.0+unknown'
+
+# Public names resolved on first access (PEP 562) so that importing the
+# package does not pull in the HTTP client, parsers and extractors up front.
+_LAZY_IMPORTS = {
+    'Crawler': '.core.crawler',
+    'BaseExtractor': '.extractors.base_extractor',
+    'EcommerceExtractor': '.extractors.ecommerce_extractor',
+    'NewsExtractor': '.extractors.news_extractor',
+    'SocialMediaExtractor': '.extractors.social_media_extractor',
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + __all__)
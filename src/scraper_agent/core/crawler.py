@@ -0,0 +1,1069 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Enhanced Web Crawler Core Module
+
+A high-performance web crawler with advanced features:
+- Asynchronous HTTP fetching with configurable concurrency
+- Sophisticated throttling and rate limiting
+- Comprehensive error handling and retry mechanisms
+- Proxy rotation support
+- Cache support for respecting revisit rules
+- Enhanced JavaScript rendering capabilities
+"""
+
+import os
+import asyncio
+import csv
+import functools
+import time
+import json
+import logging
+import random
+import re
+import urllib.parse
+from datetime import datetime
+from typing import List, Dict, Set, Deque, Optional, Callable, Any, Union, Tuple, Generator, Pattern, TYPE_CHECKING
+from urllib.robotparser import RobotFileParser
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from concurrent.futures import ProcessPoolExecutor
+import threading
+from collections import deque
+import hashlib
+from pathlib import Path
+import traceback
+
+import httpx
+from bs4 import BeautifulSoup
+from lxml import etree
+from fake_useragent import UserAgent
+
+try:
+    import uvloop
+except ImportError:  # Optional "fast-loop" extra
+    uvloop = None
+
+try:
+    import xxhash
+except ImportError:  # Optional "fast-hash" extra
+    xxhash = None
+
+from scraper_agent.middlewares.proxy_middleware import ProxyMiddleware
+from scraper_agent.middlewares.rate_limiter import RateLimiter
+from scraper_agent.utils.url_utils import normalize_url, is_same_domain, get_domain
+from scraper_agent.utils.cache_manager import CacheManager
+from scraper_agent.utils.http_utils import extract_redirect_location, is_html_response
+from scraper_agent.utils.browser_utils import setup_browser_page, create_browser_context, get_sync_api
+from scraper_agent.utils.html_utils import extract_links, extract_tree_links, parse_html, sniff_encoding
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler('crawler.log'),
+        logging.StreamHandler()
+    ]
+)
+
+logger = logging.getLogger('crawler')
+
+# Compiled XPath expressions used by the default parser
+_XP_TITLE = etree.XPath('(//title)[1]')
+_XP_META_DESCRIPTION = etree.XPath("(//meta[@name='description'])[1]")
+_XP_META_KEYWORDS = etree.XPath("(//meta[@name='keywords'])[1]")
+_XP_CANONICAL = etree.XPath("(//link[contains(concat(' ', normalize-space(@rel), ' '), ' canonical ')])[1]")
+_XP_PARAGRAPHS = etree.XPath('//p')
+
+HEADER_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+
+# Redirect hops followed manually when follow_redirects is disabled
+MAX_REDIRECTS = 20
+
+# Upper bound of the random jitter added to each retry delay, in seconds
+RETRY_JITTER = 0.25
+
+# Number of user agents sampled from fake_useragent when the crawler starts
+USER_AGENT_POOL_SIZE = 64
+
+# Agent name matched against robots.txt rules when no User-Agent header is configured
+ROBOTS_USER_AGENT = 'ScraperAgentBot'
+
+# Robots.txt verdicts memoized per crawler
+ROBOTS_CACHE_SIZE = 100_000
+
+
+def _can_fuse(pattern: Pattern[str]) -> bool:
+    """Check whether a regex can be embedded in an alternation without changing meaning"""
+    # Groups could be shifted under backreferences and inline flags would
+    # apply to the whole combined pattern
+    return pattern.groups == 0 and pattern.flags == re.UNICODE
+
+
+def _compile_url_filters(patterns: List[str]) -> List[Pattern[str]]:
+    """
+    Compile URL filter patterns, fusing them into a single alternation when
+    possible so each URL is checked with one search instead of a Python loop.
+    """
+    compiled = [re.compile(pattern) for pattern in patterns]
+    if len(compiled) > 1 and all(_can_fuse(pattern) for pattern in compiled):
+        return [re.compile('|'.join(f'(?:{pattern.pattern})' for pattern in compiled))]
+    return compiled
+
+
+def _url_digest(url: str) -> str:
+    """Hex digest of a URL, used to name per-page files"""
+    if xxhash is not None:
+        return xxhash.xxh3_128_hexdigest(url)
+    return hashlib.md5(url.encode()).hexdigest()
+
+
+def _content_fingerprint(html: str) -> int:
+    """64-bit fingerprint of a page's HTML for duplicate detection"""
+    data = html.encode('utf-8')
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(data)
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'little')
+
+
+def _first_attribute(elements: List[Any], name: str, default: str) -> str:
+    """Return an attribute of the first matched element, or a default"""
+    if elements:
+        value = elements[0].get(name)
+        if value is not None:
+            return value
+    return default
+
+
+def _parse_default_page(html: str, url: str) -> Dict[str, Any]:
+    """
+    Default parser for web pages when no custom parser matches.
+    
+    Module-level so it can run in a parse worker process.
+    """
+    # Parse once with lxml; every field below is a compiled XPath or a
+    # single tree walk rather than a BeautifulSoup search
+    tree = parse_html(html)
+    
+    result = {}
+    result['url'] = url
+    result['crawl_time'] = datetime.now().isoformat()
+    
+    # Extract metadata
+    title = _XP_TITLE(tree)
+    result['title'] = title[0].text_content().strip() if title else "No title found"
+    
+    # Extract meta description and keywords
+    result['description'] = _first_attribute(_XP_META_DESCRIPTION(tree), 'content', "No description found")
+    result['keywords'] = _first_attribute(_XP_META_KEYWORDS(tree), 'content', "No keywords found")
+    
+    # Extract canonical URL if present
+    result['canonical_url'] = _first_attribute(_XP_CANONICAL(tree), 'href', url)
+    
+    # Calculate page size
+    result['page_size_bytes'] = len(html.encode('utf-8'))
+    
+    # Extract main text content
+    text_content = []
+    for p in _XP_PARAGRAPHS(tree):
+        text = p.text_content().strip()
+        if text:
+            text_content.append(text)
+    result['text_content'] = '\n'.join(text_content)
+    
+    # Extract headers
+    headers: Dict[str, List[str]] = {tag: [] for tag in HEADER_TAGS}
+    for header in tree.iter(*HEADER_TAGS):
+        headers[header.tag].append(header.text_content().strip())
+    result['headers'] = headers
+    
+    # Extract links
+    result['links'] = extract_tree_links(tree, url)
+    
+    return result
+
+
+def _flatten_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten a crawl result into a CSV row, joining lists with ';'"""
+    flat_result = {}
+    for key, value in result.items():
+        if isinstance(value, dict):
+            for sub_key, sub_value in value.items():
+                if isinstance(sub_value, list):
+                    flat_result[f"{key}_{sub_key}"] = ';'.join(sub_value)
+                else:
+                    flat_result[f"{key}_{sub_key}"] = sub_value
+        elif isinstance(value, list):
+            flat_result[key] = ';'.join(value)
+        else:
+            flat_result[key] = value
+    return flat_result
+
+
+class _NoStoreCookiePolicy(DefaultCookiePolicy):
+    """Cookie policy that sends configured cookies but never stores new ones"""
+    
+    def set_ok(self, cookie, request) -> bool:
+        return False
+
+
+class Crawler:
+    """
+    Enhanced web crawler with advanced features for performance, resilience and flexibility.
+    """
+    
+    def __init__(
+        self,
+        start_urls: List[str],
+        output_dir: str = 'crawled_data',
+        max_depth: int = 3,
+        delay: float = 1.0,
+        respect_robots_txt: bool = True,
+        playwright_mode: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+        allowed_domains: Optional[List[str]] = None,
+        url_patterns: Optional[List[str]] = None,
+        exclude_patterns: Optional[List[str]] = None,
+        custom_parsers: Optional[Dict[str, Callable[[BeautifulSoup, str], Dict[str, Any]]]] = None,
+        max_pages: int = 100,
+        timeout: int = 30,
+        screenshot_dir: Optional[str] = None,
+        max_workers: int = 5,
+        proxies: Optional[List[str]] = None,
+        retry_count: int = 3,
+        retry_delay: float = 2.0,
+        cache_enabled: bool = True,
+        cache_expiry: int = 3600,  # 1 hour in seconds
+        verbose: bool = False,
+        cookies: Optional[Dict[str, str]] = None,
+        follow_redirects: bool = True,
+        verify_ssl: bool = True,
+        preserve_cookies: bool = True,
+        parse_workers: int = 0,
+        skip_duplicate_content: bool = False
+    ):
+        """
+        Initialize the crawler with the given parameters.
+        
+        Args:
+            start_urls: List of URLs to start crawling from
+            output_dir: Directory to save crawled data
+            max_depth: Maximum depth to crawl (0 means only crawl start_urls)
+            delay: Delay between requests in seconds
+            respect_robots_txt: Whether to respect robots.txt rules
+            playwright_mode: Whether to use Playwright for JavaScript rendering
+            headers: Custom headers to use for requests
+            allowed_domains: List of domains to restrict crawling to
+            url_patterns: List of regex patterns that URLs must match to be crawled
+            exclude_patterns: List of regex patterns that URLs must NOT match to be crawled
+            custom_parsers: Dictionary mapping URL patterns to custom parser functions
+            max_pages: Maximum number of pages to crawl
+            timeout: Timeout for requests in seconds
+            screenshot_dir: Directory to save screenshots (only used in playwright_mode)
+            max_workers: Maximum number of concurrent workers for parallel processing
+            proxies: List of proxy URLs to rotate through
+            retry_count: Number of times to retry failed requests
+            retry_delay: Delay between retries in seconds
+            cache_enabled: Whether to enable HTTP cache
+            cache_expiry: Time in seconds until cached responses expire
+            verbose: Whether to print verbose output
+            cookies: Cookies to include in requests
+            follow_redirects: Whether to follow HTTP redirects
+            verify_ssl: Whether to verify SSL certificates
+            preserve_cookies: Whether to maintain cookies between requests to the same domain
+            parse_workers: Number of processes parsing pages with the default parser
+                (0 parses in a thread of the crawling process)
+            skip_duplicate_content: Whether to skip parsing pages whose HTML is identical
+                to a page already crawled, recording them as duplicates instead
+        """
+        self.start_urls = [normalize_url(url) for url in start_urls]
+        self.output_dir = output_dir
+        self.max_depth = max_depth
+        self.base_delay = delay
+        self.respect_robots_txt = respect_robots_txt
+        self.playwright_mode = playwright_mode
+        self.ua = UserAgent()
+        # Sample once; requests then rotate through the pool with random.choice
+        self._user_agents = [self.ua.random for _ in range(USER_AGENT_POOL_SIZE)]
+        self.allowed_domains = allowed_domains
+        self._allowed_domains = frozenset(allowed_domains) if allowed_domains else None
+        self.url_patterns = _compile_url_filters(url_patterns) if url_patterns else None
+        self.exclude_patterns = _compile_url_filters(exclude_patterns) if exclude_patterns else None
+        self.custom_parsers = custom_parsers or {}
+        self._compile_custom_parsers()
+        self.max_pages = max_pages
+        self.timeout = timeout
+        self.screenshot_dir = screenshot_dir
+        self.max_workers = max_workers
+        self.retry_count = retry_count
+        self.retry_delay = retry_delay
+        # Exponential backoff schedule: retry_delay, 2x, 4x, ...
+        self._retry_backoff = [retry_delay * (1 << attempt) for attempt in range(retry_count)]
+        self.cache_enabled = cache_enabled
+        self.verbose = verbose
+        self.cookies = cookies or {}
+        self.follow_redirects = follow_redirects
+        self.verify_ssl = verify_ssl
+        self.preserve_cookies = preserve_cookies
+        self.parse_workers = parse_workers
+        self.skip_duplicate_content = skip_duplicate_content
+        
+        # Set default headers if none provided
+        if headers is None:
+            self.headers = {
+                'User-Agent': random.choice(self._user_agents),
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+                'Accept-Language': 'en-US,en;q=0.5',
+                'Accept-Encoding': 'gzip, deflate, br',
+                'Connection': 'keep-alive',
+                'Upgrade-Insecure-Requests': '1',
+                'Cache-Control': 'max-age=0',
+                'DNT': '1',  # Do Not Track request header
+            }
+        else:
+            self.headers = headers
+        
+        # robots.txt rules are matched against a fixed identity, not the
+        # user agent rotated per request
+        self.robots_user_agent = self.headers.get('User-Agent', ROBOTS_USER_AGENT) if headers else ROBOTS_USER_AGENT
+        self._build_request_headers()
+        
+        # Initialize middleware components
+        self.proxy_middleware = ProxyMiddleware(proxies) if proxies else None
+        self.rate_limiter = RateLimiter(base_delay=delay, per_domain_rules={})
+        self.cache_manager = CacheManager(
+            enabled=cache_enabled,
+            expiry=cache_expiry,
+            cache_dir=os.path.join(output_dir, '.cache')
+        )
+        
+        # Create output directories
+        os.makedirs(self.output_dir, exist_ok=True)
+        if self.playwright_mode and self.screenshot_dir:
+            os.makedirs(self.screenshot_dir, exist_ok=True)
+            
+        # Initialize variables
+        self.visited_urls: Set[str] = set()
+        self.robots_parsers: Dict[str, RobotFileParser] = {}
+        # Links rejected by robots.txt keep reappearing on every page, so
+        # verdicts are memoized per URL once the domain's parser is loaded
+        self._robots_allowed = functools.lru_cache(maxsize=ROBOTS_CACHE_SIZE)(self._robots_verdict)
+        self.crawl_results: List[Dict[str, Any]] = []
+        
+        # Pooled HTTP clients keyed by proxy URL (None for direct connections).
+        # httpx binds proxies per client, so each proxy gets its own pool.
+        # Async clients are only touched from the crawl's event loop.
+        self._clients: Dict[Optional[str], httpx.Client] = {}
+        self._clients_lock = threading.Lock()
+        self._async_clients: Dict[Optional[str], httpx.AsyncClient] = {}
+        self._robots_fetches: Dict[str, 'asyncio.Future[None]'] = {}
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        
+        # Crawl state (visited URLs, results, counters and the robots.txt
+        # cache) is only mutated from one thread: the event loop in HTTP
+        # mode, the caller's thread in Playwright mode.
+        self.pages_crawled = 0
+        # Content fingerprint -> first URL seen with that content
+        self._content_fingerprints: Dict[int, str] = {}
+        
+        logger.info(f"Initialized crawler with {len(start_urls)} start URLs")
+    
+    def _build_request_headers(self) -> None:
+        """
+        Pre-build the header dicts sent with requests from self.headers.
+        
+        Page requests pick one of the per-user-agent dicts at random, so no
+        headers are copied or mutated per request. robots.txt is fetched
+        under the same identity its rules are matched against.
+        """
+        if 'User-Agent' in self.headers:
+            self._request_headers = [{**self.headers, 'User-Agent': user_agent} for user_agent in self._user_agents]
+        else:
+            self._request_headers = [dict(self.headers)]
+        self._robots_headers = {**self.headers, 'User-Agent': self.robots_user_agent}
+    
+    def _build_robots_parser(self, domain: str, robots_url: str, response: Optional[httpx.Response]) -> RobotFileParser:
+        """
+        Build a robots.txt parser from the fetched robots.txt response.
+        
+        Mirrors RobotFileParser.read(): 401/403 disallow everything, other
+        errors allow everything. A failed fetch (response is None) is treated
+        as allowing everything too, and is cached like any other outcome.
+        """
+        parser = RobotFileParser()
+        parser.set_url(robots_url)
+        if response is None:
+            parser.allow_all = True
+        elif response.status_code == 200:
+            parser.parse(response.text.splitlines())
+        elif response.status_code in (401, 403):
+            logger.warning(f"Access to robots.txt denied at {domain} (status code: {response.status_code})")
+            parser.disallow_all = True
+        else:
+            logger.warning(f"No robots.txt found at {domain} (status code: {response.status_code})")
+            parser.allow_all = True
+        return parser
+    
+    def _robots_verdict(self, domain: str, url: str) -> bool:
+        """Evaluate robots.txt rules for a URL whose domain parser is loaded (memoized per crawler)"""
+        return self.robots_parsers[domain].can_fetch(self.robots_user_agent, url)
+    
+    def _is_allowed_by_robots(self, url: str) -> bool:
+        """Check if URL is allowed to be crawled according to robots.txt"""
+        if not self.respect_robots_txt:
+            return True
+        
+        domain = get_domain(url)
+        
+        # Fetch and cache the robots parser for this domain on first sight.
+        # Playwright mode crawls from a single thread, so no lock is needed.
+        if domain not in self.robots_parsers:
+            robots_url = f"{urllib.parse.urlparse(url).scheme}://{domain}/robots.txt"
+            try:
+                response = self._get_client().get(robots_url, headers=self._robots_headers, follow_redirects=True)
+            except Exception as e:
+                logger.warning(f"Error reading robots.txt for {domain}: {e}")
+                response = None  # Assume allowed if robots.txt can't be read
+            
+            self.robots_parsers[domain] = self._build_robots_parser(domain, robots_url, response)
+        
+        return self._robots_allowed(domain, url)
+    
+    async def _fetch_robots_async(self, url: str, domain: str) -> None:
+        """Fetch and cache the robots.txt parser for a domain"""
+        robots_url = f"{urllib.parse.urlparse(url).scheme}://{domain}/robots.txt"
+        try:
+            response = await self._get_async_client().get(robots_url, headers=self._robots_headers, follow_redirects=True)
+        except Exception as e:
+            logger.warning(f"Error reading robots.txt for {domain}: {e}")
+            response = None  # Assume allowed if robots.txt can't be read
+        
+        self.robots_parsers[domain] = self._build_robots_parser(domain, robots_url, response)
+    
+    async def _is_allowed_by_robots_async(self, url: str) -> bool:
+        """Check robots.txt rules from inside the crawl's event loop"""
+        if not self.respect_robots_txt:
+            return True
+        
+        domain = get_domain(url)
+        
+        if domain not in self.robots_parsers:
+            # One fetch per domain: coroutines arriving while it is in flight
+            # await the same task instead of queueing on a lock
+            fetch = self._robots_fetches.get(domain)
+            if fetch is None:
+                fetch = self._robots_fetches[domain] = asyncio.ensure_future(self._fetch_robots_async(url, domain))
+            await fetch
+        
+        return self._robots_allowed(domain, url)
+    
+    def _is_valid_url(self, url: str) -> bool:
+        """Check if URL is valid for crawling based on various rules"""
+        if not self._passes_url_filters(url):
+            return False
+        
+        # Check robots.txt rules
+        return self._is_allowed_by_robots(url)
+    
+    def _passes_url_filters(self, url: str) -> bool:
+        """Check URL against the pattern, domain and visited rules (everything but robots.txt)"""
+        return bool(self._filter_links([url]))
+    
+    def _filter_links(self, links: List[str]) -> List[str]:
+        """
+        Apply the pattern, domain and visited rules to a batch of links.
+        
+        Each rule is a single comprehension over the surviving links, cheapest
+        first, so most of a page's links are dropped by the visited-set lookup
+        before any regex runs.
+        
+        Args:
+            links: Absolute URLs found on a page
+            
+        Returns:
+            Links that pass every rule except robots.txt, in their original order
+        """
+        # Basic URL validation and already-visited URLs
+        visited = self.visited_urls
+        links = [link for link in links if link and link.startswith(('http://', 'https://')) and link not in visited]
+        
+        # Drop excluded URLs
+        if self.exclude_patterns:
+            for pattern in self.exclude_patterns:
+                links = [link for link in links if pattern.search(link) is None]
+        
+        # Keep URLs matching a required pattern
+        if self.url_patterns:
+            patterns = self.url_patterns
+            links = [link for link in links if any(pattern.search(link) for pattern in patterns)]
+        
+        # Check domain restrictions
+        if self._allowed_domains:
+            allowed = self._allowed_domains
+            links = [link for link in links if get_domain(link) in allowed]
+        
+        return links
+    
+    def _mark_visited(self, url: str) -> bool:
+        """Record a URL as visited (queued for crawling), returning False if it already was"""
+        if url in self.visited_urls:
+            return False
+        self.visited_urls.add(url)
+        return True
+    
+    def _default_parser(self, html: str, url: str) -> Dict[str, Any]:
+        """Default parser for web pages when no custom parser matches"""
+        return _parse_default_page(html, url)
+    
+    def _compile_custom_parsers(self) -> None:
+        """Precompile the custom parser patterns, fusing them into one dispatch regex when possible"""
+        self._custom_parser_list = [(re.compile(pattern), parser_func) for pattern, parser_func in self.custom_parsers.items()]
+        self._custom_parser_re: Optional[Pattern[str]] = None
+        
+        patterns = [pattern for pattern, _ in self._custom_parser_list]
+        if len(patterns) > 1 and all(_can_fuse(pattern) for pattern in patterns):
+            # Each alternative scans the whole URL before the next one is
+            # tried, so the first pattern in insertion order still wins
+            self._custom_parser_re = re.compile('|'.join(
+                rf'[\s\S]*?(?P<p{i}>{pattern.pattern})' for i, pattern in enumerate(patterns)
+            ))
+    
+    def _get_custom_parser(self, url: str) -> Optional[Callable[[BeautifulSoup, str], Dict[str, Any]]]:
+        """Find the appropriate custom parser for a URL"""
+        if self._custom_parser_re is not None:
+            match = self._custom_parser_re.match(url)
+            if match and match.lastgroup:
+                return self._custom_parser_list[int(match.lastgroup[1:])][1]
+            return None
+        
+        for pattern, parser_func in self._custom_parser_list:
+            if pattern.search(url):
+                return parser_func
+        return None
+    
+    def _client_options(self, proxy: Optional[str]) -> Dict[str, Any]:
+        """Build the keyword arguments shared by the sync and async HTTP clients"""
+        # Cookies set by servers are kept in the client's domain-aware
+        # jar when preserving cookies; otherwise only the configured
+        # cookies are ever sent.
+        policy = DefaultCookiePolicy() if self.preserve_cookies else _NoStoreCookiePolicy()
+        cookies = httpx.Cookies(CookieJar(policy=policy))
+        for name, value in self.cookies.items():
+            cookies.set(name, value)
+        
+        return {
+            'http2': True,
+            'proxy': proxy,
+            'cookies': cookies,
+            'timeout': self.timeout,
+            'follow_redirects': self.follow_redirects,
+            'verify': self.verify_ssl,
+            # Bodies without a charset in Content-Type are decoded using
+            # their <meta> declaration instead of always as UTF-8
+            'default_encoding': sniff_encoding,
+            # Size the pool so every worker can hold a connection open
+            'limits': httpx.Limits(
+                max_connections=max(100, self.max_workers),
+                max_keepalive_connections=max(20, self.max_workers)
+            ),
+        }
+    
+    def _get_client(self, proxy: Optional[str] = None) -> httpx.Client:
+        """Return the pooled HTTP client for a proxy, creating it on first use"""
+        client = self._clients.get(proxy)
+        if client is not None:
+            return client
+        
+        with self._clients_lock:
+            client = self._clients.get(proxy)
+            if client is None:
+                client = httpx.Client(**self._client_options(proxy))
+                self._clients[proxy] = client
+        
+        return client
+    
+    def _get_async_client(self, proxy: Optional[str] = None) -> httpx.AsyncClient:
+        """Return the pooled async HTTP client for a proxy, creating it on first use"""
+        client = self._async_clients.get(proxy)
+        if client is None:
+            client = httpx.AsyncClient(**self._client_options(proxy))
+            self._async_clients[proxy] = client
+        return client
+    
+    def close(self) -> None:
+        """Close the pooled HTTP clients and their connections"""
+        with self._clients_lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        
+        for client in clients:
+            client.close()
+    
+    async def _aclose(self) -> None:
+        """Close the pooled async HTTP clients; must run on the loop that created them"""
+        clients = list(self._async_clients.values())
+        self._async_clients.clear()
+        
+        for client in clients:
+            await client.aclose()
+    
+    async def _make_request(self, url: str) -> Tuple[Optional[httpx.Response], Optional[str]]:
+        """Make HTTP request with retries and proxy support"""
+        err_msg = None
+        
+        # Check if cached response exists and is valid. The cache lives on
+        # disk, so keep its file I/O off the event loop.
+        if self.cache_enabled:
+            cached_response = await asyncio.to_thread(self.cache_manager.get_response, url)
+            if cached_response is not None:
+                return cached_response, None
+        
+        for retry in range(self.retry_count + 1):
+            if retry:
+                logger.warning(f"Error fetching {url}: {err_msg}. Retrying ({retry}/{self.retry_count})...")
+                # Jitter keeps workers that failed together from retrying in lockstep
+                await asyncio.sleep(self._retry_backoff[retry - 1] + random.uniform(0, RETRY_JITTER))
+            
+            # Apply rate limiting
+            if self.rate_limiter:
+                domain = get_domain(url)
+                await self.rate_limiter.wait_for_rate_limit_async(domain)
+            
+            # Get proxy if configured
+            proxy = None
+            if self.proxy_middleware:
+                proxy = self.proxy_middleware.get_proxy()
+            
+            try:
+                # Rotate user agent for each request to avoid bot detection
+                headers = random.choice(self._request_headers)
+                
+                # Make the request over the pooled client for this proxy.
+                # The body is streamed so it is only downloaded for HTML
+                # pages; PDFs, images and the like are rejected from the
+                # headers alone and their connection released.
+                client = self._get_async_client(proxy)
+                response = await client.send(client.build_request('GET', url, headers=headers), stream=True)
+                if response.status_code == 200 and not is_html_response(response):
+                    await response.aclose()
+                    return response, None
+                await response.aread()
+                
+                # Cache the response if enabled; the disk write happens in
+                # the cache manager's flusher thread
+                if self.cache_enabled and response.status_code == 200:
+                    self.cache_manager.cache_response(url, response)
+                
+                return response, None
+                
+            except httpx.ConnectError as e:
+                err_msg = f"Connection Error: {str(e)}"
+            except httpx.TimeoutException as e:
+                err_msg = f"Timeout Error: {str(e)}"
+            except httpx.HTTPError as e:
+                err_msg = f"Request Error: {str(e)}"
+            except Exception as e:
+                err_msg = f"Unexpected Error: {str(e)}"
+        
+        logger.error(f"Failed to fetch {url} after {self.retry_count} attempts: {err_msg}")
+        return None, err_msg
+    
+    async def _process_page_with_requests(self, url: str) -> Tuple[Optional[str], str, Optional[str]]:
+        """
+        Fetch a page using the HTTP client, returning its HTML or an error,
+        and the URL it was fetched from after any manually followed redirects
+        """
+        for _ in range(MAX_REDIRECTS + 1):
+            response, error = await self._make_request(url)
+            
+            if error or response is None:
+                return None, url, error
+            
+            # Handle redirects if not following automatically
+            if self.follow_redirects or response.status_code not in (301, 302, 303, 307, 308):
+                break
+            redirect_url = extract_redirect_location(response)
+            if not redirect_url:
+                break
+            # Location may be relative to the current URL
+            redirect_url = urllib.parse.urljoin(url, redirect_url)
+            logger.info(f"Following redirect from {url} to {redirect_url}")
+            url = redirect_url
+        else:
+            return None, url, f"Too many redirects (more than {MAX_REDIRECTS})"
+        
+        # Only process pages with 200 status code and HTML content
+        if response.status_code != 200:
+            return None, url, f"HTTP Error: {response.status_code}"
+            
+        if not is_html_response(response):
+            return None, url, f"Not HTML content: {response.headers.get('content-type', '').lower()}"
+        
+        return response.text, url, None
+    
+    def _process_page_with_playwright(self, url: str, page: 'Page') -> Tuple[Optional[str], Optional[str]]:
+        """Render a page using Playwright, returning its HTML or an error"""
+        PlaywrightTimeoutError = get_sync_api().TimeoutError
+        
+        try:
+            # Navigate to the URL
+            response = page.goto(
+                url,
+                timeout=self.timeout * 1000,  # Playwright uses milliseconds
+                wait_until="networkidle"
+            )
+            
+            if not response:
+                return None, "Failed to get response from page"
+                
+            if response.status != 200:
+                return None, f"HTTP Error: {response.status}"
+                
+            # Wait for content to load
+            page.wait_for_load_state("networkidle")
+            
+            # Take screenshot if enabled
+            if self.screenshot_dir:
+                url_hash = _url_digest(url)
+                screenshot_path = os.path.join(self.screenshot_dir, f"{url_hash}.png")
+                page.screenshot(path=screenshot_path, full_page=True)
+            
+            # Get the HTML content
+            return page.content(), None
+            
+        except PlaywrightTimeoutError:
+            return None, "Timeout while loading page"
+        except Exception as e:
+            logger.error(f"Error processing {url} with Playwright: {str(e)}\n{traceback.format_exc()}")
+            return None, f"Error with Playwright: {str(e)}"
+    
+    def _error_result(self, url: str, depth: int, error: Optional[str]) -> Dict[str, Any]:
+        """Build the result record for a page that could not be processed"""
+        return {
+            'url': url,
+            'crawl_time': datetime.now().isoformat(),
+            'status': 'error',
+            'error': error or 'Unknown error',
+            'links': [],
+            'depth': depth
+        }
+    
+    def _duplicate_result(self, url: str, depth: int, html: str) -> Optional[Dict[str, Any]]:
+        """
+        Build the result record for a page whose HTML matches an earlier page,
+        or return None (and remember the page) if its content is new.
+        """
+        if not self.skip_duplicate_content:
+            return None
+        
+        original_url = self._content_fingerprints.setdefault(_content_fingerprint(html), url)
+        if original_url == url:
+            return None
+        
+        logger.info(f"Skipping {url}: same content as {original_url}")
+        return {
+            'url': url,
+            'crawl_time': datetime.now().isoformat(),
+            'status': 'duplicate',
+            'duplicate_of': original_url,
+            'links': [],
+            'depth': depth
+        }
+    
+    def _parse_page(self, html: str, url: str) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Parse a fetched page with the matching custom parser, falling back to
+        the default parser. Returns the parsed data and the page's links.
+        """
+        custom_parser = self._get_custom_parser(url)
+        if custom_parser:
+            try:
+                # Custom parsers work on a BeautifulSoup tree
+                result = custom_parser(BeautifulSoup(html, 'lxml'), url)
+                return result, extract_links(html, url)
+            except Exception as e:
+                logger.error(f"Error in custom parser for {url}: {str(e)}")
+        
+        result = self._default_parser(html, url)
+        return result, result['links']
+    
+    def _process_url(self, url: str, depth: int, page: 'Page', url_queue: Deque[Tuple[str, int]]) -> Dict[str, Any]:
+        """Process a single URL with Playwright and return extracted data"""
+        logger.info(f"Processing URL: {url} (depth: {depth})")
+        
+        html, error = self._process_page_with_playwright(url, page)
+        
+        # Return error result if processing failed
+        if error or html is None:
+            return self._error_result(url, depth, error)
+        
+        # Pages repeating an earlier page's content are not parsed again
+        duplicate = self._duplicate_result(url, depth, html)
+        if duplicate is not None:
+            return duplicate
+        
+        # Parse the page and add depth and found links to the result
+        try:
+            result, links = self._parse_page(html, url)
+        except Exception as e:
+            return self._error_result(url, depth, f"Error parsing HTML: {str(e)}")
+        result['depth'] = depth
+        result['links'] = links
+        result['status'] = 'success'
+        
+        # Queue child URLs if not at max depth
+        if depth < self.max_depth:
+            queue_count = 0
+            for link in self._filter_links(links):
+                if self._is_allowed_by_robots(link) and self._mark_visited(link):
+                    url_queue.append((link, depth + 1))
+                    queue_count += 1
+            
+            logger.debug(f"Queued {queue_count} new URLs from {url}")
+        
+        # Update crawl metrics
+        self.pages_crawled += 1
+        
+        return result
+    
+    async def _process_url_async(self, url: str, depth: int, url_queue: 'asyncio.Queue[Tuple[str, int]]') -> Dict[str, Any]:
+        """Process a single URL over HTTP and return extracted data"""
+        logger.info(f"Processing URL: {url} (depth: {depth})")
+        
+        html, page_url, error = await self._process_page_with_requests(url)
+        
+        # Return error result if processing failed
+        if error or html is None:
+            return self._error_result(url, depth, error)
+        
+        # Pages repeating an earlier page's content are not parsed again
+        duplicate = self._duplicate_result(url, depth, html)
+        if duplicate is not None:
+            return duplicate
+        
+        # Parse the page and add depth and found links to the result. Parsing
+        # is CPU-bound; run it in a worker process when a parse pool is
+        # configured, else in a thread, so other fetches proceed. Custom
+        # parsers may not be picklable, so they always run in-process. After
+        # a redirect, relative links resolve against the page's final URL.
+        try:
+            if self._parse_pool is not None and self._get_custom_parser(page_url) is None:
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(self._parse_pool, _parse_default_page, html, page_url)
+                links = result['links']
+            else:
+                result, links = await asyncio.to_thread(self._parse_page, html, page_url)
+        except Exception as e:
+            return self._error_result(url, depth, f"Error parsing HTML: {str(e)}")
+        result['depth'] = depth
+        result['links'] = links
+        result['status'] = 'success'
+        
+        # Queue child URLs if not at max depth
+        if depth < self.max_depth:
+            queue_count = 0
+            for link in self._filter_links(links):
+                # Re-check visited after the robots.txt await: another worker
+                # may have queued the same link in the meantime
+                if await self._is_allowed_by_robots_async(link) and self._mark_visited(link):
+                    url_queue.put_nowait((link, depth + 1))
+                    queue_count += 1
+            
+            logger.debug(f"Queued {queue_count} new URLs from {url}")
+        
+        # Update crawl metrics
+        self.pages_crawled += 1
+        
+        return result
+    
+    def _worker(self, url_queue: Deque[Tuple[str, int]]) -> None:
+        """
+        Worker function for Playwright crawling.
+        
+        Drains the queue with a single browser page; links found on each page
+        are appended to the same queue, so the browser is launched once per crawl.
+        """
+        with get_sync_api().sync_playwright() as playwright:
+            # Launch the browser once and render every page in one context;
+            # cookies belong to the context, which Page has no API to set
+            browser = setup_browser_page(playwright)
+            context = create_browser_context(
+                browser,
+                user_agent=random.choice(self._user_agents),
+                stealth_mode=False,
+                ignore_https_errors=not self.verify_ssl,
+                cookies=[
+                    {"name": name, "value": value, "url": self.start_urls[0]}
+                    for name, value in self.cookies.items()
+                ]
+            )
+            page = context.new_page()
+            
+            # Configure page
+            page.set_default_timeout(self.timeout * 1000)
+            
+            try:
+                # Stop once max pages has been reached
+                while url_queue and self.pages_crawled < self.max_pages:
+                    url, depth = url_queue.popleft()
+                    
+                    # Process the URL and add the result to the results list
+                    self.crawl_results.append(self._process_url(url, depth, page, url_queue))
+            
+            finally:
+                page.close()
+                context.close()
+                browser.close()
+    
+    async def _async_worker(self, url_queue: 'asyncio.Queue[Tuple[str, int]]') -> None:
+        """Worker coroutine that processes queued URLs until cancelled"""
+        while True:
+            url, depth = await url_queue.get()
+            try:
+                # Skip the rest of the queue once max pages is reached
+                if self.pages_crawled >= self.max_pages:
+                    continue
+                
+                result = await self._process_url_async(url, depth, url_queue)
+                self.crawl_results.append(result)
+            except Exception as e:
+                logger.error(f"Worker error: {str(e)}")
+            finally:
+                url_queue.task_done()
+    
+    async def _crawl_async(self, start_urls: List[str]) -> None:
+        """Crawl over HTTP with max_workers coroutines sharing pooled async clients"""
+        # Robots fetch tasks belong to this crawl's event loop
+        self._robots_fetches = {}
+        if self.respect_robots_txt:
+            # Load robots.txt for the start domains up front, concurrently
+            start_domains = {get_domain(url): url for url in start_urls}
+            await asyncio.gather(*(self._is_allowed_by_robots_async(url) for url in start_domains.values()))
+        
+        url_queue: 'asyncio.Queue[Tuple[str, int]]' = asyncio.Queue()
+        for url in start_urls:
+            url_queue.put_nowait((url, 0))
+        
+        workers = [asyncio.create_task(self._async_worker(url_queue)) for _ in range(max(1, self.max_workers))]
+        try:
+            await url_queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            await self._aclose()
+    
+    def crawl(self) -> List[Dict[str, Any]]:
+        """Crawl starting from the provided URLs"""
+        start_time = time.time()
+        logger.info(f"Starting crawl with {len(self.start_urls)} URLs, max depth {self.max_depth}, max pages {self.max_pages}")
+        
+        # Reset state for new crawl
+        self.visited_urls = set()
+        self.crawl_results = []
+        self.pages_crawled = 0
+        self._content_fingerprints = {}
+        # Pick up any changes made to self.headers since the last crawl
+        self._build_request_headers()
+        
+        # URLs are marked visited when queued, so duplicates never enter the queue
+        start_urls = [url for url in self.start_urls if self._mark_visited(url)]
+        
+        if self.playwright_mode:
+            # Playwright's sync API is bound to the thread that started it,
+            # so rendered pages are processed sequentially from a plain deque
+            self._worker(deque((url, 0) for url in start_urls))
+        else:
+            # Plain HTTP fetching is I/O-bound, so a single event loop can
+            # keep max_workers requests in flight without a thread each.
+            # uvloop's libuv-based loop cuts per-socket overhead when installed.
+            if self.parse_workers > 0:
+                self._parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers)
+                # Start the worker processes now, before the event loop
+                # and its helper threads exist
+                self._parse_pool.submit(int).result()
+            
+            run = uvloop.run if uvloop is not None else asyncio.run
+            try:
+                run(self._crawl_async(start_urls))
+            finally:
+                if self._parse_pool is not None:
+                    self._parse_pool.shutdown()
+                    self._parse_pool = None
+        
+        # Release pooled connections; clients are recreated on the next crawl
+        self.close()
+        
+        # Wait for queued cache writes so the next run sees them on disk
+        self.cache_manager.flush()
+        
+        elapsed_time = time.time() - start_time
+        logger.info(f"Crawl completed in {elapsed_time:.2f} seconds. Processed {self.pages_crawled} pages.")
+        
+        return self.crawl_results
+    
+    def export_to_json(self, filename: Optional[str] = None) -> str:
+        """Export crawl results to JSON file"""
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = os.path.join(self.output_dir, f"crawl_results_{timestamp}.json")
+        
+        # Stream one result at a time rather than serializing the whole list
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write('[')
+            for index, result in enumerate(self.crawl_results):
+                f.write(',\n' if index else '\n')
+                json.dump(result, f, ensure_ascii=False, indent=2)
+            f.write('\n]' if self.crawl_results else ']')
+        
+        logger.info(f"Results exported to JSON: {filename}")
+        return filename
+    
+    def export_to_csv(self, filename: Optional[str] = None) -> str:
+        """Export crawl results to CSV file"""
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = os.path.join(self.output_dir, f"crawl_results_{timestamp}.csv")
+        
+        # First pass collects the columns in order of first appearance; the
+        # second flattens and writes each row, so only one row is held at a time
+        fieldnames = dict.fromkeys(
+            key for result in self.crawl_results for key in _flatten_result(result)
+        )
+        
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=list(fieldnames))
+            writer.writeheader()
+            for result in self.crawl_results:
+                writer.writerow(_flatten_result(result))
+        
+        logger.info(f"Results exported to CSV: {filename}")
+        return filename
+    
+    def add_custom_parser(self, url_pattern: str, parser_func: Callable[[BeautifulSoup, str], Dict[str, Any]]) -> None:
+        """Add a custom parser function for URLs matching the given pattern"""
+        self.custom_parsers[url_pattern] = parser_func
+        self._compile_custom_parsers()
+        logger.info(f"Added custom parser for pattern: {url_pattern}")
+    
+    def clear_cache(self) -> None:
+        """Clear the HTTP cache"""
+        if self.cache_manager:
+            self.cache_manager.clear_cache()
+            logger.info("Cache cleared")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Return statistics about the crawl"""
+        stats = {
+            'pages_crawled': self.pages_crawled,
+            'unique_domains': len(set(get_domain(url) for url in self.visited_urls)),
+            'total_urls_discovered': len(self.visited_urls),
+            'success_count': sum(1 for r in self.crawl_results if r.get('status') == 'success'),
+            'error_count': sum(1 for r in self.crawl_results if r.get('status') == 'error'),
+            'content_size_total': sum(r.get('page_size_bytes', 0) for r in self.crawl_results),
+        }
+        return stats 
\ No newline at end of file
@@ -0,0 +1,664 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Base Extractor Module
+
+Provides the base class for all data extractors. Extractors are responsible for
+extracting structured data from web pages based on their content type.
+"""
+
+import copy
+import inspect
+import io
+import json
+import os
+import threading
+import urllib.parse
+import weakref
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, Any, ClassVar, FrozenSet, Iterator, Optional, List, Set, Tuple, Type, Union
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
+
+from ..utils.html_utils import parse_html
+from ..utils.url_utils import normalize_url
+
+try:
+    import orjson
+except ImportError:  # Optional "fast-json" extra
+    orjson = None
+
+# Common main content containers, in order of preference
+MAIN_CONTENT_SELECTORS = (
+    'main',
+    'article',
+    '#content',
+    '#main',
+    '.content',
+    '.main',
+    '.post',
+    '.entry',
+    '[role="main"]'
+)
+
+# Compiled once instead of on every get_main_content call
+_MAIN_CONTENT_SELECTORS = tuple(soupsieve.compile(selector) for selector in MAIN_CONTENT_SELECTORS)
+_MAIN_CONTENT_ANY = soupsieve.compile(', '.join(MAIN_CONTENT_SELECTORS))
+_MAIN_CONTENT_OR_PARAGRAPH = soupsieve.compile(', '.join(MAIN_CONTENT_SELECTORS + ('p',)))
+
+
+def _loads_json(text: str) -> Any:
+    """Parse JSON with orjson when installed, else the standard library"""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # json also accepts NaN, Infinity and integers beyond 64 bits
+            pass
+    return json.loads(text)
+
+
+def _parse_json_ld(text: Optional[str]) -> Optional[Any]:
+    """
+    Parse the contents of a JSON-LD script, or return None if it is not a
+    JSON object or array. The first-character check rejects empty and
+    non-JSON scripts without paying for a failed parse.
+    """
+    if not text:
+        return None
+    text = text.strip()
+    if not text or text[0] not in '{[':
+        return None
+    try:
+        return _loads_json(text)
+    except ValueError:
+        return None
+
+
+def _declares_required_tags(extractor_cls: type) -> bool:
+    """
+    Whether an extractor class, or a base below BaseExtractor, sets its own
+    REQUIRED_TAGS; only those opt in to from_html()'s partial parse.
+    """
+    return any('REQUIRED_TAGS' in vars(klass) for klass in extractor_cls.__mro__[:-1]
+               if klass is not BaseExtractor)
+
+
+def _extract_page(extractor_cls: type, config: Dict[str, Any], html: str, url: str) -> Dict[str, Any]:
+    """
+    Parse and extract a single page; module-level so it can run in a worker process.
+    """
+    extractor = extractor_cls(dict(config))
+    if _declares_required_tags(extractor_cls):
+        soup = extractor_cls.from_html(html)
+    else:
+        soup = BeautifulSoup(html, 'lxml')
+    if not extractor.can_extract(soup, url):
+        return {}
+    return extractor.extract(soup, url)
+
+
+def _pick_main_content(candidates: List[Any]) -> Optional[Any]:
+    """
+    Pick the main content container from elements in document order: the
+    first element matching the highest-priority selector that matches any.
+    """
+    for selector in _MAIN_CONTENT_SELECTORS:
+        for content in candidates:
+            if selector.match(content):
+                return content
+    return None
+
+
+class BaseExtractor(ABC):
+    """
+    Base class for all data extractors.
+    
+    All specific extractors should inherit from this class and implement
+    the extract method to extract data from a particular type of content.
+    """
+    
+    # Tags (with their contents) that the extractor reads. from_html() parses
+    # only these; extractors that inspect arbitrary markup set it to None.
+    # div and section hold the id/class/role containers that
+    # MAIN_CONTENT_SELECTORS looks for, so get_main_content still finds them.
+    REQUIRED_TAGS: Optional[FrozenSet[str]] = frozenset({
+        'meta', 'script', 'p', 'img', 'main', 'article', 'figure', 'figcaption', 'div', 'section'
+    })
+    
+    # Number of recent extract_cached results kept per instance; 0 disables
+    RESULT_CACHE_SIZE = 256
+    
+    # Meta tags and JSON-LD, main content and lxml copy of the most recently
+    # inspected soup. They do not depend on an extractor's configuration, so
+    # they are shared by all extractors: auto-selection runs can_extract of
+    # several extractors and then extract on the same page.
+    _head_data: ClassVar[Optional[Tuple['weakref.ref[BeautifulSoup]', Dict[str, str], List[Any]]]] = None
+    _main_content: ClassVar[Optional[Tuple['weakref.ref[BeautifulSoup]', Any]]] = None
+    _lxml_tree: ClassVar[Optional[Tuple['weakref.ref[BeautifulSoup]', Any]]] = None
+    
+    # Extractor classes in definition order, and one shared instance of each
+    _registry: ClassVar[List[Type['BaseExtractor']]] = []
+    _instances: ClassVar[Dict[Type['BaseExtractor'], 'BaseExtractor']] = {}
+    
+    def __init_subclass__(cls, register: bool = True, **kwargs: Any):
+        """
+        Register subclasses so they can be chosen automatically by pick_extractor.
+        
+        Args:
+            register: Whether to add the class to the registry; pass
+                register=False in the class statement to opt out
+        """
+        super().__init_subclass__(**kwargs)
+        if register:
+            BaseExtractor._registry.append(cls)
+    
+    @classmethod
+    def shared_instance(cls) -> 'BaseExtractor':
+        """
+        Get the shared, default-configured instance of this extractor class.
+        
+        The instance is created on first use and reused afterwards, so its
+        caches carry over between pages.
+        
+        Returns:
+            Extractor instance
+        """
+        instances = BaseExtractor._instances
+        if cls not in instances:
+            instances[cls] = cls()
+        return instances[cls]
+    
+    @classmethod
+    def registered_extractors(cls) -> List['BaseExtractor']:
+        """
+        Get the shared instance of every registered extractor.
+        
+        Abstract subclasses, such as shared helper bases, are registered too
+        (ABCMeta only sets their abstract methods after __init_subclass__
+        runs) but skipped here, since they cannot be instantiated.
+        
+        Returns:
+            Extractor instances in registration order
+        """
+        return [
+            extractor_cls.shared_instance() for extractor_cls in BaseExtractor._registry
+            if not inspect.isabstract(extractor_cls)
+        ]
+    
+    @classmethod
+    def pick_extractor(cls, soup: BeautifulSoup, url: str) -> Optional['BaseExtractor']:
+        """
+        Find the first registered extractor that can handle a page.
+        
+        Args:
+            soup: BeautifulSoup object representing the parsed HTML
+            url: URL of the page being processed
+            
+        Returns:
+            Shared extractor instance, or None if no extractor applies
+        """
+        for extractor in cls.registered_extractors():
+            if extractor.can_extract(soup, url):
+                return extractor
+        return None
+    
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the extractor with optional configuration.
+        
+        Args:
+            config: Configuration dictionary for customizing extraction behavior
+        """
+        self.config = config or {}
+        
+        # Recent extract_cached results, least recently used first; parsers
+        # sharing an extractor may call extract_cached from several threads
+        self._results: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._results_lock = threading.Lock()
+    
+    @classmethod
+    def from_html(cls, html: Union[str, bytes]) -> BeautifulSoup:
+        """
+        Parse a page for this extractor, keeping only the tags it needs.
+        
+        Skipping unneeded subtrees makes the BeautifulSoup tree much cheaper
+        to build for extractors that declare REQUIRED_TAGS.
+        
+        Args:
+            html: Raw HTML of the page
+            
+        Returns:
+            BeautifulSoup object to pass to can_extract and extract
+        """
+        if cls.REQUIRED_TAGS is None:
+            return BeautifulSoup(html, 'lxml')
+        
+        strainer = SoupStrainer(sorted(cls.REQUIRED_TAGS))
+        return BeautifulSoup(html, 'lxml', parse_only=strainer)
+    
+    @staticmethod
+    def parse_head_only(html: Union[str, bytes]) -> Dict[str, Any]:
+        """
+        Read page metadata from <head> without parsing the rest of the document.
+        
+        The page is streamed through lxml and parsing stops as soon as the
+        head ends (or the body starts), so the cost no longer grows with the
+        size of the body. Meta tags and JSON-LD placed inside <body> are not
+        seen; use extract_meta_tags and extract_structured_data for those.
+        
+        Args:
+            html: Raw HTML of the page
+        
+        Returns:
+            Dictionary with the page title, canonical URL, meta tags
+            (name/property to content) and parsed JSON-LD objects
+        """
+        head: Dict[str, Any] = {
+            'title': None,
+            'canonical_url': None,
+            'meta_tags': {},
+            'structured_data': []
+        }
+        meta_tags = head['meta_tags']
+        
+        if isinstance(html, str):
+            source, encoding = io.BytesIO(html.encode('utf-8')), 'utf-8'
+        else:
+            source, encoding = io.BytesIO(html), None
+        
+        try:
+            for event, element in etree.iterparse(source, events=('start', 'end'), html=True, encoding=encoding):
+                tag = element.tag
+                if event == 'start':
+                    if tag == 'body':
+                        break
+                    continue
+                if tag == 'head':
+                    break
+                
+                attrib = element.attrib
+                if tag == 'meta':
+                    content = attrib.get('content')
+                    key = attrib.get('name') or attrib.get('property')
+                    if content is not None and key:
+                        meta_tags[key] = content
+                elif tag == 'title':
+                    if head['title'] is None:
+                        head['title'] = (element.text or '').strip()
+                elif tag == 'link':
+                    if head['canonical_url'] is None and 'canonical' in attrib.get('rel', '').lower().split():
+                        head['canonical_url'] = attrib.get('href')
+                elif tag == 'script' and attrib.get('type') == 'application/ld+json':
+                    data = _parse_json_ld(element.text)
+                    if data is not None:
+                        head['structured_data'].append(data)
+                
+                # Drop what has been read so memory stays bounded
+                element.clear()
+        except etree.XMLSyntaxError:
+            # Empty document
+            pass
+        
+        return head
+    
+    def extract_batch(self, pages: List[Tuple[str, str]], workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Extract data from many pages, parsing them in parallel worker processes.
+        
+        Each page is extracted by a fresh instance of this extractor's class
+        built with a copy of its config, so the class must be importable
+        (defined at module level) and its config picklable. Pages are parsed
+        in full, or with from_html() when the class sets its own REQUIRED_TAGS;
+        the tags it lists are then the only ones extract() will see.
+        
+        Args:
+            pages: List of (html, url) tuples
+            workers: Number of worker processes (defaults to the CPU count;
+                1 extracts in this process)
+            
+        Returns:
+            List of extracted data in the same order as pages; an empty dict
+            for pages this extractor cannot handle
+        """
+        workers = workers or os.cpu_count() or 1
+        htmls = [html for html, _ in pages]
+        urls = [url for _, url in pages]
+        
+        if workers == 1 or len(pages) < 2:
+            return [_extract_page(type(self), self.config, html, url) for html, url in pages]
+        
+        # Hand pages out in chunks so each worker gets a few batches
+        chunksize = max(1, len(pages) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_extract_page, repeat(type(self)), repeat(self.config), htmls, urls, chunksize=chunksize))
+    
+    def _cache_key(self, url: str) -> str:
+        """
+        Get the extract_cached key for a URL: the normalized URL, without its
+        query string if the 'cache_ignore_query' config option is set.
+        """
+        key = normalize_url(url)
+        if self.config.get('cache_ignore_query'):
+            key = urllib.parse.urlsplit(key)._replace(query='').geturl()
+        return key
+    
+    def extract_cached(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
+        """
+        Extract data from a web page, reusing the result for a URL seen recently.
+        
+        Pages revisited in one run (retries, overlapping pagination, URLs
+        listed twice) are extracted only once. Up to RESULT_CACHE_SIZE
+        results are kept, evicting the least recently used.
+        
+        Args:
+            soup: BeautifulSoup object representing the parsed HTML
+            url: URL of the page being processed
+            
+        Returns:
+            Dictionary of extracted data (a deep copy of the cached result, so
+            callers may modify it freely)
+        """
+        if self.RESULT_CACHE_SIZE <= 0:
+            return self.extract(soup, url)
+        
+        key = self._cache_key(url)
+        results = self._results
+        with self._results_lock:
+            result = results.get(key)
+            if result is not None:
+                results.move_to_end(key)
+        if result is not None:
+            return copy.deepcopy(result)
+        
+        # Extract outside the lock so other threads are not held up
+        result = self.extract(soup, url)
+        with self._results_lock:
+            results[key] = result
+            results.move_to_end(key)
+            if len(results) > self.RESULT_CACHE_SIZE:
+                results.popitem(last=False)
+        return copy.deepcopy(result)
+    
+    @abstractmethod
+    def extract(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
+        """
+        Extract data from a web page.
+        
+        Args:
+            soup: BeautifulSoup object representing the parsed HTML
+            url: URL of the page being processed
+            
+        Returns:
+            Dictionary of extracted data
+        """
+        pass
+    
+    @abstractmethod
+    def can_extract(self, soup: BeautifulSoup, url: str) -> bool:
+        """
+        Check if this extractor can extract data from a given page.
+        
+        Args:
+            soup: BeautifulSoup object representing the parsed HTML
+            url: URL of the page being processed
+            
+        Returns:
+            True if the extractor can process this page
+        """
+        pass
+    
+    def clean_text(self, text: str) -> str:
+        """
+        Clean and normalize a text string.
+        
+        Args:
+            text: Text to clean
+            
+        Returns:
+            Cleaned text
+        """
+        if not text:
+            return ""
+        
+        # Collapse whitespace runs; split() also drops leading and trailing
+        # whitespace, and runs in C faster than an equivalent regex sub
+        return ' '.join(text.split())
+    
+    def _extract_head_data(self, soup: BeautifulSoup) -> Tuple[Dict[str, str], List[Any]]:
+        """
+        Collect meta tags and JSON-LD structured data in a single pass over the page.
+        
+        The result is remembered for the last soup seen by any extractor, so
+        repeated calls for the same page (e.g. from can_extract and then
+        extract) do not walk the tree again. The soup is assumed not to change in between; the same
+        holds for get_main_content.
+        
+        Args:
+            soup: BeautifulSoup object representing the parsed HTML
+            
+        Returns:
+            Tuple of (meta tag name/property to content, parsed JSON-LD objects)
+        """
+        cached = self._head_data
+        if cached is not None and cached[0]() is soup:
+            return cached[1], cached[2]
+        
+        meta_tags: Dict[str, str] = {}
+        structured_data: List[Any] = []
+        
+        for element in soup.find_all(['meta', 'script']):
+            attrs = element.attrs
+            if element.name == 'meta':
+                # Standard meta tags, keyed by name or else property
+                content = attrs.get('content')
+                if content is None:
+                    continue
+                key = attrs.get('name') or attrs.get('property')
+                if key:
+                    meta_tags[key] = content
+            elif attrs.get('type') == 'application/ld+json':
+                # JSON-LD script tags; get_text() also covers scripts whose
+                # text is split across several strings (e.g. CDATA sections)
+                data = _parse_json_ld(element.string or element.get_text())
+                if data is not None:
+                    structured_data.append(data)
+        
+        BaseExtractor._head_data = (weakref.ref(soup), meta_tags, structured_data)
+        return meta_tags, structured_data
+    
+    def _lxml_root(self, soup: BeautifulSoup) -> Any:
+        """
+        Get an lxml copy of the page for XPath and CSS queries.
+        
+        lxml evaluates selectors in C, far faster than BeautifulSoup's
+        Python-level tree walks, so extractors that run many queries per
+        page convert once and query the copy. The copy is remembered for the
+        last soup seen, like _extract_head_data.
+        
+        Args:
+            soup: BeautifulSoup object representing the parsed HTML
+            
+        Returns:
+            Root lxml.html element of the page
+        """
+        cached = self._lxml_tree
+        if cached is not None and cached[0]() is soup:
+            return cached[1]
+        
+        root = parse_html(str(soup))
+        BaseExtractor._lxml_tree = (weakref.ref(soup), root)
+        return root
+    
+    def extract_meta_tags(self, soup: BeautifulSoup) -> Dict[str, str]:
+        """
+        Extract meta tags from a web page.
+        
+        Callers holding the raw HTML rather than a soup can use
+        utils.scan_meta_tags, which skips building the tree.
+        
+        Args:
+            soup: BeautifulSoup object representing the parsed HTML
+            
+        Returns:
+            Dictionary of meta tag name/property to content
+        """
+        return dict(self._extract_head_data(soup)[0])
+    
+    def extract_structured_data(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+        """
+        Extract JSON-LD structured data from a web page.
+        
+        Args:
+            soup: BeautifulSoup object representing the parsed HTML
+            
+        Returns:
+            List of parsed JSON-LD objects
+        """
+        return list(self._extract_head_data(soup)[1])
+    
+    def get_main_content(self, soup: BeautifulSoup) -> Optional[BeautifulSoup]:
+        """
+        Try to extract the main content area of a web page.
+        
+        Args:
+            soup: BeautifulSoup object representing the parsed HTML
+            
+        Returns:
+            BeautifulSoup object for the main content or None if not found
+        """
+        cached = self._main_content
+        if cached is not None and cached[0]() is soup:
+            return cached[1]
+        
+        # One walk collects every candidate container in document order;
+        # the first selector (in priority order) with a hit picks the result,
+        # the same element select_one() would have returned for it
+        content = _pick_main_content(_MAIN_CONTENT_ANY.select(soup))
+        BaseExtractor._main_content = (weakref.ref(soup), content)
+        return content
+    
+    def extract_images(self, soup: BeautifulSoup, base_url: str) -> List[Dict[str, str]]:
+        """
+        Extract images from a web page with their relevant attributes.
+        
+        Args:
+            soup: BeautifulSoup object representing the parsed HTML
+            base_url: Base URL for resolving relative image URLs
+            
+        Returns:
+            List of dictionaries with image information
+        """
+        images = []
+        
+        # Split the base URL once; most image URLs are absolute, protocol-
+        # relative or root-relative and can be resolved without urljoin
+        base_parts = urllib.parse.urlsplit(base_url)
+        base_scheme = base_parts.scheme
+        base_prefix = f"{base_scheme}://{base_parts.netloc}"
+        
+        # Caption of each <figure> seen so far (None if it has none), so
+        # figures holding several images are searched only once
+        figure_captions: Dict[int, Optional[str]] = {}
+        
+        for img in soup.find_all('img'):
+            # Read attributes from the tag's dict directly rather than
+            # through Tag.get/__getitem__ for every lookup
+            attrs = img.attrs
+            
+            # Get source URL
+            src = attrs.get('src') or attrs.get('data-src')
+            if not src:
+                continue
+            
+            image_info = {}
+                
+            # Handle relative URLs. Paths with dot segments go through
+            # urljoin, which resolves them.
+            if src.startswith(('http://', 'https://')):
+                image_info['url'] = src
+            elif src.startswith('//'):
+                image_info['url'] = f"{base_scheme}:{src}"
+            elif src.startswith('/') and '/.' not in src:
+                image_info['url'] = base_prefix + src
+            else:
+                image_info['url'] = urllib.parse.urljoin(base_url, src)
+            
+            # Get alt text
+            image_info['alt'] = attrs.get('alt', '')
+            
+            # Get caption
+            parent = img.parent
+            if parent.name == 'figure':
+                key = id(parent)
+                if key in figure_captions:
+                    caption = figure_captions[key]
+                else:
+                    figcaption = parent.find('figcaption')
+                    caption = self.clean_text(figcaption.get_text()) if figcaption else None
+                    figure_captions[key] = caption
+                if caption is not None:
+                    image_info['caption'] = caption
+            
+            # Get dimensions if available
+            if 'width' in attrs:
+                image_info['width'] = attrs['width']
+            if 'height' in attrs:
+                image_info['height'] = attrs['height']
+            
+            images.append(image_info)
+        
+        return images
+    
+    def iter_text_blocks(self, soup: BeautifulSoup) -> Iterator[str]:
+        """
+        Yield text blocks (paragraphs) from a web page one at a time.
+        
+        Lets callers that consume blocks once (chunkers, classifiers) avoid
+        holding every cleaned paragraph of the page in memory.
+        
+        Args:
+            soup: BeautifulSoup object representing the parsed HTML
+            
+        Yields:
+            Text blocks in document order
+        """
+        cached = self._main_content
+        if cached is not None and cached[0]() is soup:
+            # Main content already located for this page
+            paragraphs = (cached[1] or soup).find_all('p')
+        else:
+            # Find main content candidates and paragraphs in the same walk.
+            # With main content only its subtree is searched again; without,
+            # the paragraphs already found are used instead of walking the
+            # page twice.
+            elements = _MAIN_CONTENT_OR_PARAGRAPH.select(soup)
+            content = _pick_main_content(elements)
+            BaseExtractor._main_content = (weakref.ref(soup), content)
+            if content is not None:
+                paragraphs = content.find_all('p')
+            else:
+                paragraphs = [element for element in elements if element.name == 'p']
+        
+        # Extract paragraphs
+        for p in paragraphs:
+            text = self.clean_text(p.get_text())
+            if len(text) > 20:  # Skip very short paragraphs
+                yield text
+    
+    def get_text_blocks(self, soup: BeautifulSoup) -> List[str]:
+        """
+        Extract text blocks (paragraphs) from a web page.
+        
+        Args:
+            soup: BeautifulSoup object representing the parsed HTML
+            
+        Returns:
+            List of text blocks
+        """
+        return list(self.iter_text_blocks(soup))
@@ -0,0 +1,907 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+E-commerce Extractor Module
+
+Specialized extractor for e-commerce product pages that extracts
+structured product information such as prices, variants, descriptions, etc.
+"""
+
+import re
+import itertools
+import urllib.parse
+import weakref
+from typing import Dict, Any, List, Optional, Tuple, Union
+from bs4 import BeautifulSoup, Tag
+from lxml import etree
+
+from .base_extractor import MAIN_CONTENT_SELECTORS, BaseExtractor, _loads_json
+from .lxml_query import css_select, css_select_one, find, find_all, find_previous, get_text, text_getter
+
+# Patterns compiled once at import rather than on every call
+
+# Page signals checked by can_extract: add to cart / buy now buttons and
+# product option fields
+_BUTTON_TAGS = frozenset({'button', 'a'})
+_PURCHASE_BUTTON_RE = re.compile(r'add to ?(cart|bag|basket)|buy (now|it)', re.I)
+_VARIANT_FIELD_RE = re.compile(r'variant|option|size|color', re.I)
+
+# JSON-LD @type values of product pages
+_PRODUCT_TYPES = frozenset({'Product', 'IndividualProduct', 'ProductModel'})
+
+# Price parsing
+_DECIMAL_RE = re.compile(r'^\d+(\.\d+)?$')
+_PRICE_NUMBER_RE = re.compile(r'(\d+[.,]?\d*)')
+_CURRENCY_BY_SYMBOL = {'$': 'USD', '£': 'GBP', '€': 'EUR', '¥': 'JPY'}
+
+# Availability text meaning the product can be bought
+_IN_STOCK_MARKERS = ('in stock', 'available', 'shipping today')
+
+# Variant scripts and option elements
+_VARIANTS_SCRIPT_RE = re.compile(r'(variants|product_variants)')
+_VARIANTS_JSON_RE = re.compile(r'variants\s*:\s*(\[.*?\])', re.DOTALL)
+_OPTION_SELECT_RE = re.compile(r'variant|option|attribute', re.I)
+_OPTION_GROUP_CLASS_RE = re.compile(r'options|variants|swatches', re.I)
+_OPTION_CLASS_RE = re.compile(r'option|swatch|variant', re.I)
+_OPTION_PLACEHOLDERS = frozenset({'choose', 'select', 'choose an option'})
+
+# Specification list items
+_SPEC_ITEM_CLASS_RE = re.compile(r'item|attribute|spec', re.I)
+_SPEC_LABEL_CLASS_RE = re.compile(r'label|name|key', re.I)
+_SPEC_VALUE_CLASS_RE = re.compile(r'value|data', re.I)
+
+# Review items
+_REVIEW_CLASS_RE = re.compile(r'review|testimonial', re.I)
+_REVIEW_AUTHOR_CLASS_RE = re.compile(r'author|name|user', re.I)
+_RATING_CLASS_RE = re.compile(r'rating|stars', re.I)
+_RATING_NUMBER_RE = re.compile(r'(\d+(\.\d+)?)')
+_REVIEW_CONTENT_CLASS_RE = re.compile(r'content|text|description', re.I)
+_REVIEW_DATE_CLASS_RE = re.compile(r'date|time', re.I)
+
+# Related product items
+_PRODUCT_ITEM_CLASS_RE = re.compile(r'product|item', re.I)
+_PRODUCT_NAME_CLASS_RE = re.compile(r'title|name', re.I)
+_PRICE_CLASS_RE = re.compile(r'price', re.I)
+
+# The extract methods query an lxml copy of the page (BaseExtractor._lxml_root)
+# with the lxml_query helpers and these extractor-specific lookups
+_XP_VALUED_OPTIONS = etree.XPath(".//option[@value != '']")
+_XP_LABEL_FOR = etree.XPath('(//label[@for = $id])[1]')
+_XP_LABEL_WITHOUT_FOR = etree.XPath('(//label[not(@for)])[1]')
+
+
+def _main_content(root: Any) -> Optional[Any]:
+    """Main content container, as BaseExtractor.get_main_content()."""
+    for selector in MAIN_CONTENT_SELECTORS:
+        content = css_select_one(root, selector)
+        if content is not None:
+            return content
+    return None
+
+
+def _find_label(root: Any, element_id: Optional[str]) -> Optional[Any]:
+    """Label for an element id, as find('label', {'for': element_id})."""
+    # A missing id matches the first label without a for attribute
+    if element_id is None:
+        matches = _XP_LABEL_WITHOUT_FOR(root)
+    else:
+        matches = _XP_LABEL_FOR(root, id=element_id)
+    return matches[0] if matches else None
+
+
+class EcommerceExtractor(BaseExtractor):
+    """
+    Extractor for e-commerce product pages.
+    
+    Extracts detailed product information including:
+    - Basic product details (name, price, currency)
+    - Variants and options
+    - Specifications and attributes
+    - Images and media
+    - Availability and shipping information
+    - Related products
+    """
+    
+    # Site-specific selectors look at arbitrary elements, so parse whole pages
+    REQUIRED_TAGS = None
+    
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the e-commerce extractor with optional configuration.
+        
+        Args:
+            config: Configuration dictionary with extraction settings
+        """
+        super().__init__(config)
+        
+        # Default config values for e-commerce extraction
+        self.config.setdefault('extract_variants', True)
+        self.config.setdefault('extract_specifications', True)
+        self.config.setdefault('extract_reviews', False)  # Reviews often require additional requests
+        self.config.setdefault('extract_related_products', True)
+        self.config.setdefault('max_images', 10)
+        # Take variants and specifications from the JSON-LD product when it
+        # lists them (hasVariant, additionalProperty), skipping the HTML scans
+        self.config.setdefault('prefer_structured_data', False)
+        
+        # First JSON-LD Product of the last page inspected (see _find_product)
+        self._last_product: Optional[Tuple['weakref.ref[BeautifulSoup]', Optional[Dict[str, Any]]]] = None
+        
+        # Common price selectors
+        self.price_selectors = [
+            '.price', 
+            '[itemprop="price"]', 
+            '.product-price',
+            '.current-price',
+            '.product__price',
+            '[data-price]',
+            'span.amount',
+            '.sales-price',
+            '.offer-price',
+            '.product-meta__price',
+            '.product-details__price',
+            '.product-single__price'
+        ]
+        
+        # Common product title selectors
+        self.name_selectors = [
+            'h1', 
+            'h1.product-title', 
+            '.product-name',
+            '[itemprop="name"]',
+            '.product__title',
+            '.product-meta__title',
+            '.product-single__title',
+            '.product-details__title'
+        ]
+    
+    def can_extract(self, soup: BeautifulSoup, url: str) -> bool:
+        """
+        Check if this extractor can handle a given page.
+        
+        Args:
+            soup: BeautifulSoup object representing the parsed HTML
+            url: URL of the page being processed
+            
+        Returns:
+            True if the page is an e-commerce product page
+        """
+        # Check for common product page indicators, cheapest first
+        # 1. URL patterns
+        url_path = urllib.parse.urlparse(url).path.lower()
+        if any(segment in url_path for segment in ['/product/', '/products/', '/item/', '/p/']):
+            return True
+        
+        # 2. Product schema markup, parsed once per page and shared with extract
+        if self._find_product(soup) is not None:
+            return True
+            
+        # 3. Price indicators, matched as one selector list so the page is
+        # walked once rather than once per selector
+        if soup.select_one(', '.join(self.price_selectors)) is not None:
+            return True
+        
+        # 4. Add to cart / buy now buttons and product option fields (size,
+        # color), found in one walk over the candidate elements
+        for tag in soup.find_all(['button', 'a', 'select', 'input']):
+            if tag.name in _BUTTON_TAGS:
+                text = tag.string
+                if text is not None and _PURCHASE_BUTTON_RE.search(text):
+                    return True
+            else:
+                field_name = tag.get('name')
+                if field_name is not None and _VARIANT_FIELD_RE.search(field_name):
+                    return True
+            
+        return False
+    
+    def extract(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
+        """
+        Extract product information from an e-commerce page.
+        
+        Args:
+            soup: BeautifulSoup object representing the parsed HTML
+            url: URL of the page being processed
+            
+        Returns:
+            Dictionary of extracted product data
+        """
+        result = {
+            'type': 'product',
+            'url': url,
+            'extracted_data': {}
+        }
+        
+        # Try to get structured data first (most reliable)
+        result['extracted_data'] = self._extract_from_structured_data(soup)
+        
+        # If no structured data or incomplete, use HTML extraction
+        if not result['extracted_data'] or not result['extracted_data'].get('name'):
+            # Extract product data from HTML
+            html_data = self._extract_from_html(soup, url)
+            
+            # Merge with any structured data, preferring structured data where available
+            if result['extracted_data']:
+                for key, value in html_data.items():
+                    if key not in result['extracted_data'] or not result['extracted_data'][key]:
+                        result['extracted_data'][key] = value
+            else:
+                result['extracted_data'] = html_data
+        
+        # Extract additional data that might not be in structured data
+        variants = None
+        specifications = None
+        if self.config.get('prefer_structured_data'):
+            product = self._find_product(soup)
+            if product is not None:
+                variants = self._structured_variants(product)
+                specifications = self._structured_specifications(product)
+        
+        if not variants:
+            variants = self._extract_variants(soup)
+        if not specifications:
+            specifications = self._extract_specifications(soup)
+        
+        result['extracted_data']['variants'] = variants
+        result['extracted_data']['specifications'] = specifications
+        
+        if self.config.get('extract_reviews'):
+            result['extracted_data']['reviews'] = self._extract_reviews(soup)
+            
+        if self.config.get('extract_related_products'):
+            result['extracted_data']['related_products'] = self._extract_related_products(soup, url)
+        
+        # Clean up empty values
+        result['extracted_data'] = {k: v for k, v in result['extracted_data'].items() if v}
+        
+        return result
+    
+    def _find_product(self, soup: BeautifulSoup) -> Optional[Dict[str, Any]]:
+        """
+        Find the first Product item in the page's JSON-LD structured data.
+        
+        The result is remembered for the last soup seen, so can_extract and
+        extract scan the structured data only once per page.
+        
+        Args:
+            soup: BeautifulSoup object representing the parsed HTML
+            
+        Returns:
+            The JSON-LD product object, or None if the page has none
+        """
+        cached = self._last_product
+        if cached is not None and cached[0]() is soup:
+            return cached[1]
+        
+        # @type may also be an (unhashable) list, which never matched
+        product = next(
+            (data for data in self.extract_structured_data(soup)
+             if isinstance(data.get('@type'), str) and data['@type'] in _PRODUCT_TYPES),
+            None
+        )
+        
+        self._last_product = (weakref.ref(soup), product)
+        return product
+    
+    def _extract_from_structured_data(self, soup: BeautifulSoup) -> Dict[str, Any]:
+        """
+        Extract product data from JSON-LD structured data.
+        
+        Args:
+            soup: BeautifulSoup object representing the parsed HTML
+            
+        Returns:
+            Dictionary of extracted product data
+        """
+        data = self._find_product(soup)
+        if data is None:
+            return {}
+        
+        product_data = {}
+        
+        # Basic product info
+        product_data['name'] = data.get('name')
+        product_data['description'] = data.get('description')
+        product_data['brand'] = self._extract_nested_value(data, 'brand', 'name')
+        product_data['sku'] = data.get('sku')
+        product_data['mpn'] = data.get('mpn')
+        product_data['gtin'] = data.get('gtin13') or data.get('gtin14') or data.get('gtin')
+        
+        # Price information
+        offers = data.get('offers')
+        if offers:
+            if isinstance(offers, list):
+                # Multiple offers, take the first one
+                if offers:
+                    first_offer = offers[0]
+                    product_data['price'] = first_offer.get('price')
+                    product_data['currency'] = first_offer.get('priceCurrency')
+                    product_data['availability'] = first_offer.get('availability')
+            else:
+                # Single offer
+                product_data['price'] = offers.get('price')
+                product_data['currency'] = offers.get('priceCurrency')
+                product_data['availability'] = offers.get('availability')
+        
+        # Images
+        if 'image' in data:
+            if isinstance(data['image'], list):
+                product_data['images'] = data['image'][:self.config.get('max_images', 10)]
+            else:
+                product_data['images'] = [data['image']]
+        
+        # Aggregate rating
+        if 'aggregateRating' in data:
+            product_data['rating'] = {
+                'value': data['aggregateRating'].get('ratingValue'),
+                'count': data['aggregateRating'].get('reviewCount') or data['aggregateRating'].get('ratingCount')
+            }
+        
+        return product_data
+    
+    def _structured_variants(self, product: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Get product variants from a JSON-LD product's hasVariant.
+        
+        Args:
+            product: JSON-LD product object
+            
+        Returns:
+            List of variant objects, empty if the product lists none
+        """
+        if not self.config.get('extract_variants', True):
+            return []
+        
+        variants = product.get('hasVariant')
+        if isinstance(variants, dict):
+            return [variants]
+        if isinstance(variants, list):
+            return [variant for variant in variants if isinstance(variant, dict)]
+        return []
+    
+    def _structured_specifications(self, product: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Get product specifications from a JSON-LD product's additionalProperty.
+        
+        Args:
+            product: JSON-LD product object
+            
+        Returns:
+            Dictionary of specifications, empty if the product lists none
+        """
+        if not self.config.get('extract_specifications', True):
+            return {}
+        
+        properties = product.get('additionalProperty')
+        if isinstance(properties, dict):
+            properties = [properties]
+        if not isinstance(properties, list):
+            return {}
+        
+        specs = {}
+        for prop in properties:
+            if isinstance(prop, dict) and prop.get('name') and prop.get('value') not in (None, ''):
+                specs[str(prop['name'])] = prop['value']
+        
+        return specs
+    
+    def _extract_nested_value(self, data: Dict[str, Any], *keys: str) -> Any:
+        """
+        Extract a value from a nested dictionary structure.
+        
+        Args:
+            data: Dictionary to extract from
+            *keys: Sequence of keys to navigate
+            
+        Returns:
+            Extracted value or None if not found
+        """
+        if not data or not keys:
+            return None
+        
+        value = data
+        for key in keys:
+            if not isinstance(value, dict) or key not in value:
+                return None
+            value = value[key]
+        
+        return value
+    
+    def _extract_from_html(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
+        """
+        Extract product data from HTML elements.
+        
+        Args:
+            soup: BeautifulSoup object representing the parsed HTML
+            url: URL of the page being processed
+        
+        Returns:
+            Dictionary of extracted product data
+        """
+        root = self._lxml_root(soup)
+        result = {}
+        
+        # Extract product name
+        name = None
+        for selector in self.name_selectors:
+            name_elem = css_select_one(root, selector)
+            if name_elem is not None:
+                name = self.clean_text(get_text(name_elem))
+                break
+        
+        if not name:
+            # Try h1 or first major heading
+            h1 = find(root, ('h1',))
+            if h1 is not None:
+                name = self.clean_text(get_text(h1))
+        
+        result['name'] = name
+        
+        # Extract price
+        price_text = None
+        price_currency = None
+        
+        for selector in self.price_selectors:
+            price_elem = css_select_one(root, selector)
+            if price_elem is not None:
+                price_text = get_text(price_elem).strip()
+                
+                # Try to get price from data attribute
+                data_price = price_elem.get('data-price') or price_elem.get('content')
+                if data_price and _DECIMAL_RE.match(data_price):
+                    price_text = data_price
+                
+                # Currency of the first currency symbol in the price
+                for char in price_text:
+                    price_currency = _CURRENCY_BY_SYMBOL.get(char)
+                    if price_currency:
+                        break
+                
+                break
+        
+        if price_text:
+            # Extract numeric price
+            numeric_price = _PRICE_NUMBER_RE.search(price_text)
+            if numeric_price:
+                result['price'] = numeric_price.group(1).replace(',', '.')
+                result['price_text'] = price_text
+                
+                if price_currency:
+                    result['currency'] = price_currency
+        
+        # Extract description
+        description_selectors = [
+            '.product-description',
+            '.description',
+            '[itemprop="description"]',
+            '.product-details__description',
+            '#product-description',
+            '.product__description'
+        ]
+        
+        for selector in description_selectors:
+            desc_elem = css_select_one(root, selector)
+            if desc_elem is not None:
+                result['description'] = self.clean_text(get_text(desc_elem))
+                break
+        
+        # If no specific description element found, try to get main content paragraphs
+        if not result.get('description'):
+            # Get the first few paragraphs of the main content area
+            main_content = _main_content(root)
+            if main_content is not None:
+                paragraphs = list(itertools.islice(main_content.iterdescendants('p'), 3))
+                if paragraphs:
+                    result['description'] = '\n'.join(
+                        self.clean_text(get_text(p)) for p in paragraphs
+                    )
+        
+        # Extract images, stopping as soon as max_images are collected
+        max_images = self.config.get('max_images', 10)
+        images = []
+        seen_urls = set()
+        
+        # First check for product image gallery
+        gallery_selectors = [
+            '.product-gallery img',
+            '.product-images img',
+            '.product__media-item img',
+            '.product-single__media img',
+            '.thumbnail-list img'
+        ]
+        
+        for selector in gallery_selectors:
+            if len(images) >= max_images:
+                break
+            for img in css_select(root, selector):
+                if len(images) >= max_images:
+                    break
+                src = img.get('data-src') or img.get('data-srcset') or img.get('src')
+                if src:
+                    # Make relative URLs absolute
+                    abs_src = urllib.parse.urljoin(url, src)
+                    if abs_src not in seen_urls:
+                        seen_urls.add(abs_src)
+                        images.append({
+                            'url': abs_src,
+                            'alt': img.get('alt', '')
+                        })
+        
+        # If no gallery found, use any large images on the page
+        if not images:
+            for img in root.iter('img'):
+                if len(images) >= max_images:
+                    break
+                if img.get('width') and int(img.get('width')) >= 200:
+                    src = img.get('data-src') or img.get('data-srcset') or img.get('src')
+                    if src:
+                        abs_src = urllib.parse.urljoin(url, src)
+                        if abs_src not in seen_urls:
+                            seen_urls.add(abs_src)
+                            images.append({
+                                'url': abs_src,
+                                'alt': img.get('alt', '')
+                            })
+        
+        result['images'] = images
+        
+        # Try to extract brand
+        brand_selectors = [
+            '[itemprop="brand"]',
+            '.product-meta__vendor',
+            '.product__vendor',
+            '.product-brand',
+            '.brand'
+        ]
+        
+        for selector in brand_selectors:
+            brand_elem = css_select_one(root, selector)
+            if brand_elem is not None:
+                result['brand'] = self.clean_text(get_text(brand_elem))
+                break
+        
+        # Extract availability
+        availability_selectors = [
+            '[itemprop="availability"]',
+            '.product-availability',
+            '.stock-level',
+            '.availability',
+            '.product__stock'
+        ]
+        
+        for selector in availability_selectors:
+            avail_elem = css_select_one(root, selector)
+            if avail_elem is not None:
+                text = self.clean_text(get_text(avail_elem))
+                result['availability'] = text
+                result['in_stock'] = any(s in text.lower() for s in _IN_STOCK_MARKERS)
+                break
+        
+        return result
+    
+    def _extract_variants(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+        """
+        Extract product variants (sizes, colors, etc.).
+        
+        Args:
+            soup: BeautifulSoup object representing the parsed HTML
+        
+        Returns:
+            List of variant dictionaries
+        """
+        if not self.config.get('extract_variants', True):
+            return []
+        
+        root = self._lxml_root(soup)
+        variants = []
+        
+        # Try to find variant scripts (Shopify, WooCommerce, etc.)
+        script_text = next(
+            (script.text for script in root.iter('script') if script.text and _VARIANTS_SCRIPT_RE.search(script.text)),
+            None
+        )
+        if script_text:
+            # Look for array of variant objects
+            try:
+                # Try to extract JSON objects from script
+                json_str = _VARIANTS_JSON_RE.search(script_text)
+                if json_str:
+                    # Clean up the text and parse as JSON
+                    variant_data = _loads_json(json_str.group(1).replace("'", '"'))
+                    if isinstance(variant_data, list):
+                        return variant_data
+            except ValueError:
+                pass
+        
+        # Extract from select dropdowns
+        option_selects = [select for select in root.iter('select') if _OPTION_SELECT_RE.search(select.get('name', ''))]
+        for select in option_selects:
+            option_name = select.get('name', '').replace('attribute_', '').replace('option_', '').title()
+            if not option_name:
+                label = find_previous(select, ('label', 'span'))
+                option_name = self.clean_text(get_text(label)) if label is not None else 'Option'
+            
+            # Options with a non-empty value, selected in one XPath call
+            text = text_getter(select)
+            options = []
+            for option in _XP_VALUED_OPTIONS(select):
+                option_text = self.clean_text(text(option))
+                if option_text.lower() not in _OPTION_PLACEHOLDERS:
+                    options.append(option_text)
+            
+            if options:
+                variants.append({
+                    'name': option_name,
+                    'values': options
+                })
+        
+        # Extract from radio buttons or checkboxes
+        option_groups = find_all(root, ('div', 'ul'), _OPTION_GROUP_CLASS_RE)
+        for group in option_groups:
+            # Find the option name
+            option_name = None
+            heading = find_previous(group, ('h3', 'h4', 'label', 'span'))
+            if heading is not None:
+                option_name = self.clean_text(get_text(heading))
+            
+            if not option_name:
+                option_name = 'Option'
+            
+            # Find all options
+            options = []
+            for option in find_all(group, ('input', 'li', 'div', 'a'), _OPTION_CLASS_RE):
+                if option.tag == 'input':
+                    option_text = option.get('value')
+                    if not option_text:
+                        label = _find_label(root, option.get('id'))
+                        if label is not None:
+                            option_text = self.clean_text(get_text(label))
+                else:
+                    option_text = self.clean_text(get_text(option))
+                
+                if option_text and option_text.lower() not in _OPTION_PLACEHOLDERS:
+                    options.append(option_text)
+            
+            if options:
+                variants.append({
+                    'name': option_name,
+                    'values': options
+                })
+        
+        return variants
+    
+    def _extract_specifications(self, soup: BeautifulSoup) -> Dict[str, Any]:
+        """
+        Extract product specifications and attributes.
+        
+        Args:
+            soup: BeautifulSoup object representing the parsed HTML
+        
+        Returns:
+            Dictionary of specifications
+        """
+        if not self.config.get('extract_specifications', True):
+            return {}
+        
+        root = self._lxml_root(soup)
+        specs = {}
+        
+        # Try to find specification tables
+        spec_selectors = [
+            '.product-specifications',
+            '.product-attributes',
+            '.product-info__specs',
+            '#product-specs',
+            '.specs-table',
+            '.data-table',
+            '.definition-list',
+            '.product-single__meta table'
+        ]
+        
+        for selector in spec_selectors:
+            spec_table = css_select_one(root, selector)
+            if spec_table is None:
+                continue
+            
+            # Text of the table's cells, checked for scripts once per table
+            text = text_getter(spec_table)
+            
+            # Try to extract from table
+            rows = list(spec_table.iterdescendants('tr'))
+            if rows:
+                for row in rows:
+                    cells = list(row.iterdescendants('th', 'td'))
+                    if len(cells) >= 2:
+                        key = self.clean_text(text(cells[0]))
+                        value = self.clean_text(text(cells[1]))
+                        if key and value:
+                            specs[key] = value
+                
+                # If we found specs, return them
+                if specs:
+                    return specs
+            
+            # Try to extract from definition lists
+            dl = find(spec_table, ('dl',))
+            if dl is not None:
+                dts = list(dl.iterdescendants('dt'))
+                dds = list(dl.iterdescendants('dd'))
+                
+                for i in range(min(len(dts), len(dds))):
+                    key = self.clean_text(text(dts[i]))
+                    value = self.clean_text(text(dds[i]))
+                    if key and value:
+                        specs[key] = value
+                
+                # If we found specs, return them
+                if specs:
+                    return specs
+            
+            # Try to extract from div pattern (label-value pairs)
+            spec_items = find_all(spec_table, ('div', 'li'), _SPEC_ITEM_CLASS_RE)
+            if spec_items:
+                for item in spec_items:
+                    label_elem = find(item, ('span', 'div'), _SPEC_LABEL_CLASS_RE)
+                    value_elem = find(item, ('span', 'div'), _SPEC_VALUE_CLASS_RE)
+                    
+                    if label_elem is not None and value_elem is not None:
+                        key = self.clean_text(text(label_elem))
+                        value = self.clean_text(text(value_elem))
+                        if key and value:
+                            specs[key] = value
+        
+        return specs
+    
+    def _extract_reviews(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+        """
+        Extract product reviews from the page.
+        
+        Args:
+            soup: BeautifulSoup object representing the parsed HTML
+        
+        Returns:
+            List of review dictionaries
+        """
+        # Reviews extraction is complex and often requires JavaScript or separate requests
+        # This is a basic implementation to extract reviews directly in the HTML
+        root = self._lxml_root(soup)
+        reviews = []
+        
+        review_selectors = [
+            '.product-reviews',
+            '.review-list',
+            '#reviews',
+            '.reviews',
+            '.user-reviews'
+        ]
+        
+        for selector in review_selectors:
+            review_container = css_select_one(root, selector)
+            if review_container is None:
+                continue
+            
+            # Find individual reviews
+            review_items = find_all(review_container, ('div', 'li'), _REVIEW_CLASS_RE)
+            if not review_items:
+                continue
+            
+            for item in review_items:
+                review = {}
+                
+                # Extract reviewer name
+                author_elem = find(item, ('span', 'div', 'a'), _REVIEW_AUTHOR_CLASS_RE)
+                if author_elem is not None:
+                    review['author'] = self.clean_text(get_text(author_elem))
+                
+                # Extract rating
+                rating_elem = find(item, ('meta', 'span', 'div'), itemprop='ratingValue')
+                if rating_elem is None:
+                    rating_elem = find(item, ('span', 'div'), _RATING_CLASS_RE)
+                if rating_elem is not None:
+                    if rating_elem.tag == 'meta':
+                        review['rating'] = rating_elem.get('content')
+                    else:
+                        # Try to extract numeric rating from text or classes
+                        rating_text = get_text(rating_elem)
+                        rating_match = _RATING_NUMBER_RE.search(rating_text)
+                        if rating_match:
+                            review['rating'] = rating_match.group(1)
+                        else:
+                            # Try to count stars in classes
+                            star_classes = [c for c in rating_elem.get('class', '').split() if 'star' in c.lower()]
+                            if star_classes:
+                                full_stars = len([c for c in star_classes if 'full' in c.lower()])
+                                if full_stars:
+                                    review['rating'] = str(full_stars)
+                
+                # Extract review content
+                content_elem = find(item, ('div', 'p'), _REVIEW_CONTENT_CLASS_RE)
+                if content_elem is None:
+                    content_elem = find(item, ('div', 'p'), itemprop='reviewBody')
+                if content_elem is not None:
+                    review['content'] = self.clean_text(get_text(content_elem))
+                
+                # Extract review date
+                date_elem = find(item, ('meta', 'span', 'div'), itemprop='datePublished')
+                if date_elem is None:
+                    date_elem = find(item, ('span', 'div', 'time'), _REVIEW_DATE_CLASS_RE)
+                if date_elem is not None:
+                    if date_elem.tag == 'meta':
+                        review['date'] = date_elem.get('content')
+                    else:
+                        review['date'] = self.clean_text(get_text(date_elem))
+                
+                if review:
+                    reviews.append(review)
+        
+        return reviews
+    
+    def _extract_related_products(self, soup: BeautifulSoup, url: str) -> List[Dict[str, Any]]:
+        """
+        Extract related products or recommendations.
+        
+        Args:
+            soup: BeautifulSoup object representing the parsed HTML
+            url: URL of the page being processed
+        
+        Returns:
+            List of related product dictionaries
+        """
+        root = self._lxml_root(soup)
+        related_products = []
+        
+        related_selectors = [
+            '.related-products',
+            '.recommendations',
+            '.similar-products',
+            '.product-recommendations',
+            '#related-products',
+            '.upsells',
+            '.cross-sells'
+        ]
+        
+        for selector in related_selectors:
+            container = css_select_one(root, selector)
+            if container is None:
+                continue
+            
+            # Find product items
+            product_items = find_all(container, ('div', 'li', 'article'), _PRODUCT_ITEM_CLASS_RE)
+            if not product_items:
+                continue
+            
+            for item in product_items:
+                product = {}
+                
+                # Extract product name
+                name_elem = find(item, ('h3', 'h4', 'h5', 'a'), _PRODUCT_NAME_CLASS_RE)
+                if name_elem is not None:
+                    product['name'] = self.clean_text(get_text(name_elem))
+                    
+                    # Extract URL
+                    if name_elem.tag == 'a':
+                        product_url = name_elem.get('href')
+                        if product_url:
+                            product['url'] = urllib.parse.urljoin(url, product_url)
+                
+                # Extract image
+                img_elem = find(item, ('img',))
+                if img_elem is not None:
+                    img_src = img_elem.get('data-src') or img_elem.get('src')
+                    if img_src:
+                        product['image'] = urllib.parse.urljoin(url, img_src)
+                
+                # Extract price
+                price_elem = find(item, ('span', 'div'), _PRICE_CLASS_RE)
+                if price_elem is not None:
+                    product['price'] = self.clean_text(get_text(price_elem))
+                
+                if product.get('name'):
+                    related_products.append(product)
+                    
+                    # Limit to reasonable number
+                    if len(related_products) >= 6:
+                        break
+        
+        return related_products 
\ No newline at end of file
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+lxml Query Module
+
+Counterparts of the BeautifulSoup lookups the extractors make (select,
+select_one, find, find_all, find_previous, get_text), for querying the lxml
+copy of a page returned by BaseExtractor._lxml_root. They return the same
+elements and text as the BeautifulSoup versions, but run in libxml2.
+"""
+
+import re
+import functools
+from typing import Any, Callable, FrozenSet, Iterator, List, Optional, Tuple
+from lxml import etree
+from lxml.cssselect import LxmlTranslator
+
+# Text as BeautifulSoup's get_text() sees it: script, style and template
+# contents only count when asked for the text of that element itself
+_XP_TEXT = etree.XPath('.//text()[not(ancestor::script or ancestor::style or ancestor::template)]',
+                       smart_strings=False)
+_RAW_TEXT_TAGS = frozenset({'script', 'style', 'template'})
+_XP_HAS_RAW_TEXT = etree.XPath('boolean(.//script or .//style or .//template)')
+
+# Every class and id on the page, and the classes and ids a selector needs
+_XP_CLASS_VALUES = etree.XPath('//@class', smart_strings=False)
+_XP_ID_VALUES = etree.XPath('//@id', smart_strings=False)
+_SIMPLE_COMPOUND_RE = re.compile(r'[a-zA-Z0-9]*(?:[.#][\w-]+)+')
+_CLASS_OR_ID_RE = re.compile(r'[.#][\w-]+')
+
+_TRANSLATOR = LxmlTranslator()
+
+
+@functools.lru_cache(maxsize=None)
+def compile_css(selector: str) -> etree.XPath:
+    """
+    Compile a CSS selector to XPath once per distinct selector. Like
+    select(), it matches descendants of the context node, not the node itself.
+    """
+    return etree.XPath(_TRANSLATOR.css_to_xpath(selector, prefix='descendant::'))
+
+
+@functools.lru_cache(maxsize=None)
+def _previous_xpath(tags: Tuple[str, ...]) -> etree.XPath:
+    """XPath for the nearest element with one of the tags starting before the context node."""
+    test = ' or '.join(f'self::{tag}' for tag in tags)
+    return etree.XPath(f'(preceding::*[{test}] | ancestor::*[{test}])[last()]')
+
+
+def text_strings(element: Any) -> List[str]:
+    """The strings get_text() joins for an element."""
+    if element.tag in _RAW_TEXT_TAGS:
+        return [element.text_content()]
+    return _XP_TEXT(element)
+
+
+def get_text(element: Any) -> str:
+    """Text of an element, as get_text() returns it."""
+    return ''.join(text_strings(element))
+
+
+def get_plain_text(element: Any) -> str:
+    """get_text() for elements with no script, style or template descendants."""
+    return ''.join(element.itertext())
+
+
+def text_getter(container: Any) -> Callable[[Any], str]:
+    """
+    get_text, or the cheaper get_plain_text when the container holds no
+    script, style or template elements, for reading the text of many
+    elements inside it.
+    """
+    return get_text if _XP_HAS_RAW_TEXT(container) else get_plain_text
+
+
+@functools.lru_cache(maxsize=1)
+def page_names(root: Any) -> FrozenSet[str]:
+    """
+    Classes (as '.name') and ids (as '#name') used anywhere on the page,
+    collected in one pass for the page's lxml root.
+    """
+    names = {'.' + name for value in _XP_CLASS_VALUES(root) for name in value.split()}
+    names.update('#' + value for value in _XP_ID_VALUES(root))
+    return frozenset(names)
+
+
+@functools.lru_cache(maxsize=None)
+def required_names(selector: str) -> FrozenSet[str]:
+    """
+    Classes and ids, in page_names() form, that the first compound of a
+    selector such as 'div.price' or '.specs table' requires. Empty for
+    selectors of any other form, which are always evaluated.
+    """
+    parts = selector.split(None, 1)
+    if not parts or ',' in selector or not _SIMPLE_COMPOUND_RE.fullmatch(parts[0]):
+        return frozenset()
+    return frozenset(_CLASS_OR_ID_RE.findall(parts[0]))
+
+
+def css_select(element: Any, selector: str) -> List[Any]:
+    """
+    Elements below element matching a CSS selector, as select(). Given the
+    document's root element, the root itself can match too, as it can for
+    select() on the BeautifulSoup object.
+
+    Selectors needing a class or id the page doesn't use are answered from
+    page_names() without walking the tree, so most of the extractors'
+    site-specific selectors cost one shared pass per page instead of one
+    walk each.
+    """
+    tree = element.getroottree()
+    required = required_names(selector)
+    if required and not required <= page_names(tree.getroot()):
+        return []
+    return compile_css(selector)(tree if element.getparent() is None else element)
+
+
+def css_select_one(element: Any, selector: str) -> Optional[Any]:
+    """First element matching a CSS selector, as select_one()."""
+    matches = css_select(element, selector)
+    return matches[0] if matches else None
+
+
+def iter_descendants(element: Any, tags: Tuple[str, ...],
+                     class_re: Optional['re.Pattern[str]'] = None, **attrs: str) -> Iterator[Any]:
+    """
+    Descendants with one of the tags, optionally filtered by a regex searched
+    in the class attribute and by exact attribute values, as find_all().
+    """
+    for el in element.iterdescendants(*tags):
+        if class_re is not None and not class_re.search(el.get('class', '')):
+            continue
+        if any(el.get(name) != value for name, value in attrs.items()):
+            continue
+        yield el
+
+
+def find_all(element: Any, tags: Tuple[str, ...], class_re: Optional['re.Pattern[str]'] = None,
+             **attrs: str) -> List[Any]:
+    return list(iter_descendants(element, tags, class_re, **attrs))
+
+
+def find(element: Any, tags: Tuple[str, ...], class_re: Optional['re.Pattern[str]'] = None,
+         **attrs: str) -> Optional[Any]:
+    return next(iter_descendants(element, tags, class_re, **attrs), None)
+
+
+def find_previous(element: Any, tags: Tuple[str, ...]) -> Optional[Any]:
+    """Nearest earlier element (ancestors included) with one of the tags, as find_previous()."""
+    matches = _previous_xpath(tags)(element)
+    return matches[0] if matches else None
@@ -10,12 +10,81 @@ structured article information such as headlines, authors, content, etc.
 
 import re
 import json
+import itertools
+import weakref
 import urllib.parse
 from datetime import datetime
-from typing import Dict, Any, List, Optional, Set
+from typing import Dict, Any, List, Optional, Set, Tuple
 from bs4 import BeautifulSoup, Tag
+from lxml import etree
 
 from .base_extractor import BaseExtractor
+from .lxml_query import css_select, css_select_one, find, find_all, get_text, text_getter, text_strings
+
+# Breadcrumb entries that are not real categories
+_NON_CATEGORIES = frozenset({'home', 'homepage', 'index'})
+
+# URL, class-name and author-byline patterns, compiled once for all pages
+_ARTICLE_PATH_RE = re.compile(r'/(?:article|story|news|post)/')
+_SHARE_CLASS_RE = re.compile(r'share|social', re.I)
+_RELATED_ITEM_RE = re.compile(r'item|article|story|post', re.I)
+_BY_PREFIX_RE = re.compile(r'^by\s+', re.I)
+_AUTHOR_SPLIT_RE = re.compile(r',\s*|\s+and\s+')
+_TAGLIST_SKIP_RE = re.compile(r'tag|social|share', re.I)
+_COMMENT_ITEM_RE = re.compile(r'comment|response', re.I)
+_AUTHOR_CLASS_RE = re.compile(r'author|name|user', re.I)
+_DATE_CLASS_RE = re.compile(r'date|time|when', re.I)
+_CONTENT_CLASS_RE = re.compile(r'content|text|body', re.I)
+
+# Date formats _parse_date tries after datetime.fromisoformat
+_DATE_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S%z",  # ISO 8601 with timezone
+    "%Y-%m-%dT%H:%M:%SZ",   # ISO 8601 UTC
+    "%Y-%m-%dT%H:%M:%S",    # ISO 8601 without timezone
+    "%Y-%m-%d %H:%M:%S",    # Common format
+    "%Y-%m-%d",             # Just date
+    "%B %d, %Y",            # Month name, day, year
+    "%b %d, %Y",            # Abbreviated month, day, year
+    "%d %B %Y",             # Day, month name, year
+    "%d %b %Y",             # Day, abbreviated month, year
+    "%B %d, %Y %H:%M",      # Month name, day, year, time
+    "%b %d, %Y %H:%M",      # Abbreviated month, day, year, time
+)
+
+# First <p> after an element in document order (its own descendants
+# included), as find_next('p')
+_XP_NEXT_PARAGRAPH = etree.XPath('(descendant::p | following::p)[1]')
+
+
+def _has_text(element: Any, min_length: int) -> bool:
+    """
+    Whether the stripped text of an lxml element, as get_text(strip=True)
+    counts it, is longer than min_length, without joining it into one string.
+    """
+    length = 0
+    for string in text_strings(element):
+        length += len(string.strip())
+        if length > min_length:
+            return True
+    return False
+
+
+def _embed_markup(container: Tag) -> str:
+    """
+    Lowercased tag names, attribute names and values, and script code of a
+    container and its descendants: where third-party comment embeds show up,
+    without serializing the whole subtree and its text.
+    """
+    parts = []
+    for tag in itertools.chain((container,), container.find_all(True)):
+        parts.append(tag.name)
+        for name, value in tag.attrs.items():
+            parts.append(name)
+            parts.append(' '.join(value) if isinstance(value, list) else value)
+        if tag.name == 'script' and tag.string:
+            parts.append(tag.string)
+    return ' '.join(parts).lower()
+
 
 class NewsExtractor(BaseExtractor):
     """
@@ -29,8 +98,15 @@ class NewsExtractor(BaseExtractor):
     - Categories and tags
     - Images and captions
     - Related articles
+    
+    Pages are expected to be parsed with the lxml parser, as from_html() and
+    the rest of the package do; html.parser trees are several times slower
+    to build and can nest malformed markup differently.
     """
     
+    # Site-specific selectors look at arbitrary elements, so parse whole pages
+    REQUIRED_TAGS = None
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize the news extractor with optional configuration.
@@ -46,6 +122,11 @@ class NewsExtractor(BaseExtractor):
         self.config.setdefault('max_images', 10)
         self.config.setdefault('extract_full_content', True)
         
+        # Article content container of the last page inspected (see _find_content_container)
+        self._last_content: Optional[Tuple['weakref.ref[BeautifulSoup]', Any]] = None
+        # strptime format of the last date parsed (see _parse_date)
+        self._last_date_format: Optional[str] = None
+        
         # Common article content selectors
         self.content_selectors = [
             'article',
@@ -105,38 +186,33 @@ class NewsExtractor(BaseExtractor):
         Returns:
             True if the page is a news article
         """
-        # Check for news article schema markup
+        # Cheapest signals first: the URL, then schema markup
+        url_path = urllib.parse.urlparse(url).path.lower()
+        if _ARTICLE_PATH_RE.search(url_path):
+            return True
+        
         json_ld = self.extract_structured_data(soup)
         for data in json_ld:
             if data.get('@type') in ['NewsArticle', 'Article', 'Report', 'BlogPosting']:
                 return True
         
-        # Check for common article indicators
-        # 1. URL patterns
-        url_path = urllib.parse.urlparse(url).path.lower()
-        if any(segment in url_path for segment in ['/article/', '/story/', '/news/', '/post/']):
-            return True
+        root = self._lxml_root(soup)
             
-        # 2. Content indicators - at least one main article content container
+        # Content indicators - a main article container with substantial text
         for selector in self.content_selectors:
-            if soup.select(selector):
-                # Also check for some substantial text content
-                content = soup.select_one(selector)
-                if content and len(content.get_text(strip=True)) > 500:  # Reasonable article length
-                    return True
-        
-        # 3. Check for author and date elements typical of news articles
-        author_exists = any(soup.select(selector) for selector in self.author_selectors)
-        date_exists = any(soup.select(selector) for selector in self.date_selectors)
+            content = css_select_one(root, selector)
+            if content is not None and _has_text(content, 500):  # Reasonable article length
+                return True
         
-        if author_exists and date_exists:
+        # Author and date elements typical of news articles
+        author_exists = any(css_select(root, selector) for selector in self.author_selectors)
+        if author_exists and any(css_select(root, selector) for selector in self.date_selectors):
             return True
             
-        # 4. Check for common news site patterns
-        # - Social sharing buttons
-        if soup.find_all(['a', 'div'], {'class': re.compile(r'share|social', re.I)}):
-            # Combined with a headline
-            if soup.find('h1') and len(soup.find('h1').get_text(strip=True)) > 20:
+        # Social sharing buttons combined with a headline
+        if find(root, ('a', 'div'), _SHARE_CLASS_RE) is not None:
+            h1 = find(root, ('h1',))
+            if h1 is not None and _has_text(h1, 20):
                 return True
         
         return False
@@ -283,36 +359,48 @@ class NewsExtractor(BaseExtractor):
         
         return {}
     
-    def _parse_date(self, date_str: str) -> Optional[datetime]:
+    def _parse_date(self, date_str: Any) -> Optional[datetime]:
         """
         Parse a date string into a datetime object.
         
         Args:
-            date_str: Date string to parse
+            date_str: Date string to parse; JSON-LD values that are not
+                strings (lists, numbers) are not parsed
             
         Returns:
             Datetime object or None if parsing fails
         """
-        # Try different date formats
-        formats = [
-            "%Y-%m-%dT%H:%M:%S%z",  # ISO 8601 with timezone
-            "%Y-%m-%dT%H:%M:%SZ",   # ISO 8601 UTC
-            "%Y-%m-%dT%H:%M:%S",    # ISO 8601 without timezone
-            "%Y-%m-%d %H:%M:%S",    # Common format
-            "%Y-%m-%d",             # Just date
-            "%B %d, %Y",            # Month name, day, year
-            "%b %d, %Y",            # Abbreviated month, day, year
-            "%d %B %Y",             # Day, month name, year
-            "%d %b %Y",             # Day, abbreviated month, year
-            "%B %d, %Y %H:%M",      # Month name, day, year, time
-            "%b %d, %Y %H:%M",      # Abbreviated month, day, year, time
-        ]
+        if not isinstance(date_str, str):
+            return None
+        
+        date_str = date_str.strip()
+
+        # Fast path: datetime.fromisoformat is implemented in C and covers the
+        # ISO 8601 timestamps found in most structured data
+        if date_str[:1].isdigit():
+            try:
+                return datetime.fromisoformat(date_str)
+            except ValueError:
+                pass
+
+        # Try the format that last parsed, then the rest in order; sites
+        # tend to use one format throughout
+        last_format = self._last_date_format
+        if last_format is not None:
+            try:
+                return datetime.strptime(date_str, last_format)
+            except ValueError:
+                pass
         
-        for fmt in formats:
+        for fmt in _DATE_FORMATS:
+            if fmt == last_format:
+                continue
             try:
-                return datetime.strptime(date_str, fmt)
+                date_obj = datetime.strptime(date_str, fmt)
             except ValueError:
                 continue
+            self._last_date_format = fmt
+            return date_obj
         
         return None
     
@@ -327,12 +415,13 @@ class NewsExtractor(BaseExtractor):
         Returns:
             Dictionary of extracted article data
         """
+        root = self._lxml_root(soup)
         article_data = {}
         
         # Extract headline (usually the main h1)
-        h1 = soup.find('h1')
-        if h1:
-            article_data['headline'] = self.clean_text(h1.get_text())
+        h1 = find(root, ('h1',))
+        if h1 is not None:
+            article_data['headline'] = self.clean_text(get_text(h1))
         
         # Extract subheadline (usually h2 close to h1, or element with specific class)
         subheadline_selectors = [
@@ -349,52 +438,54 @@ class NewsExtractor(BaseExtractor):
         ]
         
         for selector in subheadline_selectors:
-            subheadline = soup.select_one(selector)
-            if subheadline:
-                article_data['subheadline'] = self.clean_text(subheadline.get_text())
+            subheadline = css_select_one(root, selector)
+            if subheadline is not None:
+                article_data['subheadline'] = self.clean_text(get_text(subheadline))
                 break
                 
         # If no specific subheadline found, try to find the first paragraph with summary-like properties
-        if not article_data.get('subheadline') and h1:
+        if not article_data.get('subheadline') and h1 is not None:
             # Look for paragraphs near the headline
-            next_elem = h1.find_next('p')
-            if next_elem and 50 <= len(next_elem.get_text()) <= 300:
-                article_data['subheadline'] = self.clean_text(next_elem.get_text())
+            next_elems = _XP_NEXT_PARAGRAPH(h1)
+            if next_elems:
+                next_text = get_text(next_elems[0])
+                if 50 <= len(next_text) <= 300:
+                    article_data['subheadline'] = self.clean_text(next_text)
         
-        # Extract authors
-        authors = []
+        # Extract authors, in order of first appearance (a dict keeps the
+        # membership checks constant-time)
+        authors: Dict[str, None] = {}
         
         # Try various author selectors
         for selector in self.author_selectors:
-            author_elems = soup.select(selector)
+            author_elems = css_select(root, selector)
             for author_elem in author_elems:
                 # Check if it's a name, not just "By" or other text
-                author_text = self.clean_text(author_elem.get_text())
+                author_text = self.clean_text(get_text(author_elem))
                 if author_text and len(author_text) > 2:
                     # Clean up "By Author Name" patterns
-                    author_text = re.sub(r'^by\s+', '', author_text, flags=re.I)
+                    author_text = _BY_PREFIX_RE.sub('', author_text)
                     
                     # Split multiple authors if comma or 'and' separated
                     if ',' in author_text or ' and ' in author_text.lower():
-                        for name in re.split(r',\s*|\s+and\s+', author_text):
-                            if name and name not in authors:
-                                authors.append(name)
+                        for name in _AUTHOR_SPLIT_RE.split(author_text):
+                            if name:
+                                authors[name] = None
                     else:
-                        if author_text not in authors:
-                            authors.append(author_text)
+                        authors[author_text] = None
         
         if authors:
-            article_data['authors'] = authors
+            article_data['authors'] = list(authors)
         
         # Extract publication date
         for selector in self.date_selectors:
-            date_elem = soup.select_one(selector)
-            if date_elem:
+            date_elem = css_select_one(root, selector)
+            if date_elem is not None:
                 # Check for datetime attribute first
                 date_str = date_elem.get('datetime') or date_elem.get('content')
                 
                 if not date_str:
-                    date_str = self.clean_text(date_elem.get_text())
+                    date_str = self.clean_text(get_text(date_elem))
                 
                 if date_str:
                     article_data['date_published'] = date_str
@@ -421,10 +512,10 @@ class NewsExtractor(BaseExtractor):
         
         categories = []
         for selector in category_selectors:
-            category_elems = soup.select(selector)
+            category_elems = css_select(root, selector)
             for category_elem in category_elems:
-                category_text = self.clean_text(category_elem.get_text())
-                if category_text and category_text.lower() not in ['home', 'homepage', 'index']:
+                category_text = self.clean_text(get_text(category_elem))
+                if category_text and category_text.lower() not in _NON_CATEGORIES:
                     categories.append(category_text)
         
         if categories:
@@ -441,19 +532,19 @@ class NewsExtractor(BaseExtractor):
             '.story__tags'
         ]
         
-        tags = []
+        tags: Dict[str, None] = {}
         for selector in tag_selectors:
-            tag_container = soup.select_one(selector)
-            if tag_container:
+            tag_container = css_select_one(root, selector)
+            if tag_container is not None:
                 # Find individual tag elements
-                tag_elems = tag_container.find_all(['a', 'li', 'span'])
+                tag_elems = find_all(tag_container, ('a', 'li', 'span'))
                 for tag_elem in tag_elems:
-                    tag_text = self.clean_text(tag_elem.get_text())
-                    if tag_text and tag_text not in tags and len(tag_text) > 1:
-                        tags.append(tag_text)
+                    tag_text = self.clean_text(get_text(tag_elem))
+                    if len(tag_text) > 1:
+                        tags[tag_text] = None
         
         if tags:
-            article_data['tags'] = tags
+            article_data['tags'] = list(tags)
         
         # Extract main image
         main_image_selectors = [
@@ -470,32 +561,27 @@ class NewsExtractor(BaseExtractor):
         ]
         
         for selector in main_image_selectors:
-            img_container = soup.select_one(selector)
-            if img_container:
-                img = img_container if img_container.name == 'img' else img_container.find('img')
-                if img:
+            img_container = css_select_one(root, selector)
+            if img_container is not None:
+                img = img_container if img_container.tag == 'img' else find(img_container, ('img',))
+                if img is not None:
                     src = img.get('data-src') or img.get('data-lazy-src') or img.get('src')
                     if src:
                         article_data['main_image'] = urllib.parse.urljoin(url, src)
                         
                         # Try to get image caption
-                        caption_elem = img_container.find(['figcaption', '.caption', '.image-caption'])
-                        if caption_elem:
-                            article_data['main_image_caption'] = self.clean_text(caption_elem.get_text())
+                        caption_elem = find(img_container, ('figcaption', '.caption', '.image-caption'))
+                        if caption_elem is not None:
+                            article_data['main_image_caption'] = self.clean_text(get_text(caption_elem))
                         
                         break
         
         # If no main image found yet, try the first large image in the article
         if not article_data.get('main_image'):
-            content_container = None
-            for selector in self.content_selectors:
-                content_container = soup.select_one(selector)
-                if content_container:
-                    break
-                    
-            if content_container:
-                img = content_container.find('img')
-                if img and (img.get('width') is None or int(img.get('width', '0')) >= 200):
+            content_container = self._find_content_container(soup)
+            if content_container is not None:
+                img = find(content_container, ('img',))
+                if img is not None and (img.get('width') is None or int(img.get('width', '0')) >= 200):
                     src = img.get('data-src') or img.get('data-lazy-src') or img.get('src')
                     if src:
                         article_data['main_image'] = urllib.parse.urljoin(url, src)
@@ -511,13 +597,13 @@ class NewsExtractor(BaseExtractor):
         ]
         
         for selector in publisher_selectors:
-            publisher_elem = soup.select_one(selector)
-            if publisher_elem:
-                name_elem = publisher_elem.find('[itemprop="name"]') if publisher_elem.name != 'meta' else None
-                if name_elem:
-                    article_data['publisher'] = self.clean_text(name_elem.get_text())
+            publisher_elem = css_select_one(root, selector)
+            if publisher_elem is not None:
+                name_elem = find(publisher_elem, ('[itemprop="name"]',)) if publisher_elem.tag != 'meta' else None
+                if name_elem is not None:
+                    article_data['publisher'] = self.clean_text(get_text(name_elem))
                 else:
-                    article_data['publisher'] = self.clean_text(publisher_elem.get_text())
+                    article_data['publisher'] = self.clean_text(get_text(publisher_elem))
                 break
         
         # If no publisher found, try to extract from meta tags
@@ -536,6 +622,33 @@ class NewsExtractor(BaseExtractor):
         
         return article_data
     
+    def _find_content_container(self, soup: BeautifulSoup) -> Optional[Any]:
+        """
+        Find the article content container: the first match of the first
+        content selector that matches, in the page's lxml copy. Remembered for
+        the last page, so the main image fallback and the content extraction
+        search for it only once.
+        
+        Args:
+            soup: BeautifulSoup object representing the parsed HTML
+            
+        Returns:
+            The container element, or None if no content selector matches
+        """
+        cached = self._last_content
+        if cached is not None and cached[0]() is soup:
+            return cached[1]
+        
+        root = self._lxml_root(soup)
+        container = next(
+            (element for element in (css_select_one(root, selector) for selector in self.content_selectors)
+             if element is not None),
+            None
+        )
+        
+        self._last_content = (weakref.ref(soup), container)
+        return container
+    
     def _extract_article_content(self, soup: BeautifulSoup) -> Optional[str]:
         """
         Extract the full article content.
@@ -546,54 +659,56 @@ class NewsExtractor(BaseExtractor):
         Returns:
             Article content as plain text or None if not found
         """
-        content_element = None
-        
-        # Try to find the main content container
-        for selector in self.content_selectors:
-            content_element = soup.select_one(selector)
-            if content_element:
-                break
-        
-        if not content_element:
+        content_element = self._find_content_container(soup)
+        if content_element is None:
             return None
         
-        # Extract content paragraphs
+        # Extract headings, paragraphs, list items and blockquotes in reading order
+        text = text_getter(content_element)
         paragraphs = []
         
-        # Add heading elements in the content
-        for heading in content_element.find_all(['h2', 'h3', 'h4']):
-            # Skip if it looks like a related article heading or has very short text
-            heading_text = self.clean_text(heading.get_text())
-            if heading_text and len(heading_text) > 10 and 'related' not in heading_text.lower():
-                paragraphs.append(heading_text)
-        
-        # Add paragraph elements
-        for p in content_element.find_all('p'):
-            # Skip very short paragraphs (likely not actual content)
-            p_text = self.clean_text(p.get_text())
-            if p_text and len(p_text) > 20:
-                paragraphs.append(p_text)
-                
-        # Add list items as they might contain content
-        for ul in content_element.find_all('ul'):
-            # Skip if it looks like a tag list or social links
-            if not ul.get('class') or not any(c in ' '.join(ul['class']).lower() for c in ['tag', 'social', 'share']):
-                for li in ul.find_all('li'):
-                    li_text = self.clean_text(li.get_text())
-                    if li_text and len(li_text) > 20:
-                        paragraphs.append(f"• {li_text}")
-                        
-        # Add blockquotes
-        for quote in content_element.find_all('blockquote'):
-            quote_text = self.clean_text(quote.get_text())
-            if quote_text and len(quote_text) > 20:
-                paragraphs.append(f'"{quote_text}"')
+        for element in content_element.iterdescendants('h2', 'h3', 'h4', 'p', 'li', 'blockquote'):
+            tag = element.tag
+            if tag == 'li':
+                # List items count unless their list looks like a tag list or social links
+                if not self._in_content_list(element, content_element):
+                    continue
+            element_text = self.clean_text(text(element))
+            if not element_text:
+                continue
+            
+            if tag == 'p':
+                # Skip very short paragraphs (likely not actual content)
+                if len(element_text) > 20:
+                    paragraphs.append(element_text)
+            elif tag == 'li':
+                if len(element_text) > 20:
+                    paragraphs.append(f"• {element_text}")
+            elif tag == 'blockquote':
+                if len(element_text) > 20:
+                    paragraphs.append(f'"{element_text}"')
+            elif len(element_text) > 10 and 'related' not in element_text.lower():
+                # Skip headings that look like related article headings or have very short text
+                paragraphs.append(element_text)
         
         if not paragraphs:
             return None
             
         return '\n\n'.join(paragraphs)
     
+    @staticmethod
+    def _in_content_list(item: Any, container: Any) -> bool:
+        """
+        Whether a list item belongs to a <ul> inside container, the nearest
+        one not being a tag list or social links.
+        """
+        for parent in item.iterancestors():
+            if parent is container:
+                return False
+            if parent.tag == 'ul':
+                return not _TAGLIST_SKIP_RE.search(parent.get('class', ''))
+        return False
+    
     def _extract_related_articles(self, soup: BeautifulSoup, url: str) -> List[Dict[str, Any]]:
         """
         Extract related articles/recommended reads.
@@ -605,6 +720,7 @@ class NewsExtractor(BaseExtractor):
         Returns:
             List of related article dictionaries
         """
+        root = self._lxml_root(soup)
         related_articles = []
         
         related_selectors = [
@@ -626,40 +742,41 @@ class NewsExtractor(BaseExtractor):
         ]
         
         for selector in related_selectors:
-            container = soup.select_one(selector)
-            if not container:
+            container = css_select_one(root, selector)
+            if container is None:
                 continue
                 
             # Find article items
-            article_items = container.find_all(['div', 'li', 'article'], {'class': re.compile(r'item|article|story|post', re.I)})
-            if not article_items and container.find_all('a'):
+            article_items = find_all(container, ('div', 'li', 'article'), _RELATED_ITEM_RE)
+            if not article_items:
                 # If no specific items found, use all links in the container
-                article_items = container.find_all('a')
+                article_items = find_all(container, ('a',))
             
             if not article_items:
                 continue
-                
+            
+            text = text_getter(container)
             for item in article_items:
                 article = {}
                 
                 # Extract title and URL
-                if item.name == 'a':
+                if item.tag == 'a':
                     link = item
                 else:
-                    link = item.find('a')
+                    link = find(item, ('a',))
                     
-                if link:
-                    article['title'] = self.clean_text(link.get_text())
+                if link is not None:
+                    article['title'] = self.clean_text(text(link))
                     article['url'] = urllib.parse.urljoin(url, link.get('href'))
                 else:
                     # Try to find title separately
-                    title_elem = item.find(['h2', 'h3', 'h4', '.title', '.headline'])
-                    if title_elem:
-                        article['title'] = self.clean_text(title_elem.get_text())
+                    title_elem = find(item, ('h2', 'h3', 'h4', '.title', '.headline'))
+                    if title_elem is not None:
+                        article['title'] = self.clean_text(text(title_elem))
                         
                         # Look for link in this title
-                        title_link = title_elem.find('a')
-                        if title_link:
+                        title_link = find(title_elem, ('a',))
+                        if title_link is not None:
                             article['url'] = urllib.parse.urljoin(url, title_link.get('href'))
                 
                 # If no title found, skip this item
@@ -667,8 +784,8 @@ class NewsExtractor(BaseExtractor):
                     continue
                 
                 # Extract image
-                img = item.find('img')
-                if img:
+                img = find(item, ('img',))
+                if img is not None:
                     src = img.get('data-src') or img.get('data-lazy-src') or img.get('src')
                     if src:
                         article['image'] = urllib.parse.urljoin(url, src)
@@ -676,17 +793,17 @@ class NewsExtractor(BaseExtractor):
                 # Extract description/excerpt
                 excerpt_selectors = ['.excerpt', '.description', '.summary', '.teaser', 'p']
                 for excerpt_selector in excerpt_selectors:
-                    excerpt_elem = item.select_one(excerpt_selector)
-                    if excerpt_elem:
-                        excerpt = self.clean_text(excerpt_elem.get_text())
+                    excerpt_elem = css_select_one(item, excerpt_selector)
+                    if excerpt_elem is not None:
+                        excerpt = self.clean_text(text(excerpt_elem))
                         if excerpt and len(excerpt) > 10:
                             article['excerpt'] = excerpt
                             break
                 
                 # Extract date if available
-                date_elem = item.find(['time', '.date', '.time', '.published'])
-                if date_elem:
-                    date_str = date_elem.get('datetime') or self.clean_text(date_elem.get_text())
+                date_elem = find(item, ('time', '.date', '.time', '.published'))
+                if date_elem is not None:
+                    date_str = date_elem.get('datetime') or self.clean_text(text(date_elem))
                     if date_str:
                         article['date'] = date_str
                 
@@ -727,14 +844,15 @@ class NewsExtractor(BaseExtractor):
                 continue
                 
             # External comment system detection
-            if 'disqus' in str(container).lower():
+            embed_markup = _embed_markup(container)
+            if 'disqus' in embed_markup:
                 return [{'info': 'Comments loaded via Disqus', 'count_available': False}]
                 
-            if 'facebook' in str(container).lower() and 'comments' in str(container).lower():
+            if 'facebook' in embed_markup and 'comments' in embed_markup:
                 return [{'info': 'Comments loaded via Facebook', 'count_available': False}]
             
             # Find comment items
-            comment_items = container.find_all(['div', 'li', 'article'], {'class': re.compile(r'comment|response', re.I)})
+            comment_items = container.find_all(['div', 'li', 'article'], {'class': _COMMENT_ITEM_RE})
             if not comment_items:
                 continue
                 
@@ -746,19 +864,19 @@ class NewsExtractor(BaseExtractor):
                     continue
                 
                 # Extract author
-                author_elem = item.find(['span', 'div', 'a', 'h3', 'h4'], {'class': re.compile(r'author|name|user', re.I)})
+                author_elem = item.find(['span', 'div', 'a', 'h3', 'h4'], {'class': _AUTHOR_CLASS_RE})
                 if author_elem:
                     comment['author'] = self.clean_text(author_elem.get_text())
                 
                 # Extract date
-                date_elem = item.find(['time', 'span', 'div'], {'class': re.compile(r'date|time|when', re.I)})
+                date_elem = item.find(['time', 'span', 'div'], {'class': _DATE_CLASS_RE})
                 if date_elem:
                     date_str = date_elem.get('datetime') or self.clean_text(date_elem.get_text())
                     if date_str:
                         comment['date'] = date_str
                 
                 # Extract content
-                content_elem = item.find(['div', 'p'], {'class': re.compile(r'content|text|body', re.I)})
+                content_elem = item.find(['div', 'p'], {'class': _CONTENT_CLASS_RE})
                 if content_elem:
                     comment['content'] = self.clean_text(content_elem.get_text())
                 else:
@@ -16,6 +16,13 @@ from bs4 import BeautifulSoup, Tag
 
 from .base_extractor import BaseExtractor
 
+# og:type values used by social media pages
+_SOCIAL_OG_TYPES = frozenset({'profile', 'article:author', 'instapp:photo', 'video'})
+
+# First path segments that are site sections rather than usernames
+_RESERVED_PATHS = frozenset({'search', 'explore', 'home', 'settings'})
+
+
 class SocialMediaExtractor(BaseExtractor):
     """
     Extractor for social media content.
@@ -29,6 +36,9 @@ class SocialMediaExtractor(BaseExtractor):
     - Media attachments
     """
     
+    # Site-specific selectors look at arbitrary elements, so parse whole pages
+    REQUIRED_TAGS = None
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize the social media extractor with optional configuration.
@@ -82,7 +92,7 @@ class SocialMediaExtractor(BaseExtractor):
         # Check for OpenGraph meta tags with social media properties
         meta_tags = self.extract_meta_tags(soup)
         og_type = meta_tags.get('og:type', '')
-        if og_type in ['profile', 'article:author', 'instapp:photo', 'video']:
+        if og_type in _SOCIAL_OG_TYPES:
             return True
             
         # Check for common social media UI elements
@@ -434,7 +444,7 @@ class SocialMediaExtractor(BaseExtractor):
             # Try to extract from URL if nothing else worked
             if not data.get('author'):
                 username = path.split('/')[1]
-                if username and username not in ['search', 'explore', 'home', 'settings']:
+                if username and username not in _RESERVED_PATHS:
                     data['author'] = username
             
             # Extract replies if configured and available
@@ -446,7 +456,7 @@ class SocialMediaExtractor(BaseExtractor):
             
             # Extract username from URL
             username = path.split('/')[1]
-            if username and username not in ['search', 'explore', 'home', 'settings']:
+            if username and username not in _RESERVED_PATHS:
                 data['username'] = username
             
             # Try to extract profile info if configured
@@ -15,14 +15,10 @@ import json
 import argparse
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-import requests
-from bs4 import BeautifulSoup
 
-from src.core.crawler import Crawler
-from src.extractors.base_extractor import BaseExtractor
-from src.extractors.ecommerce_extractor import EcommerceExtractor
-from src.extractors.news_extractor import NewsExtractor
-from src.extractors.social_media_extractor import SocialMediaExtractor
+# Only the standard library is imported at module level so that argument
+# parsing (including --help) stays fast; the HTTP client, parser, crawler and
+# extractors are imported inside the functions that need them.
 
 # Configure logging
 logging.basicConfig(
@@ -123,6 +119,11 @@ def extract_data(url: str, args: argparse.Namespace) -> Dict[str, Any]:
     Returns:
         Dictionary of extracted data
     """
+    import httpx
+    from bs4 import BeautifulSoup
+    
+    from scraper_agent.extractors import BaseExtractor, EcommerceExtractor, NewsExtractor, SocialMediaExtractor
+    
     try:
         # Set up headers
         headers = {'User-Agent': args.user_agent} if args.user_agent else None
@@ -137,14 +138,6 @@ def extract_data(url: str, args: argparse.Namespace) -> Dict[str, Any]:
             except json.JSONDecodeError:
                 logger.warning(f"Failed to parse headers JSON: {args.headers}")
         
-        # Set up proxy
-        proxies = None
-        if args.proxy:
-            proxies = {
-                'http': args.proxy,
-                'https': args.proxy
-            }
-        
         # Fetch the page
         if args.verbose:
             logger.info(f"Fetching URL: {url}")
@@ -168,33 +161,34 @@ def extract_data(url: str, args: argparse.Namespace) -> Dict[str, Any]:
                     browser.close()
                     
             except ImportError:
-                logger.error("Playwright not installed. Install it with: pip install playwright")
+                logger.error("Playwright not installed. Install it with: pip install 'scraper_agent[browser]'")
                 logger.error("Then run: playwright install")
                 sys.exit(1)
                 
         else:
-            # Use requests
-            response = requests.get(
+            # Use the HTTP client
+            response = httpx.get(
                 url,
                 headers=headers,
-                proxies=proxies,
-                timeout=args.timeout
+                proxy=args.proxy,
+                timeout=args.timeout,
+                follow_redirects=True
             )
             response.raise_for_status()
             html = response.text
         
-        # Parse HTML
-        soup = BeautifulSoup(html, 'html.parser')
+        # Parse HTML with the lxml tree builder, as the crawler does; it is
+        # several times faster than the pure-Python html.parser
+        soup = BeautifulSoup(html, 'lxml')
         
         # Select extractor
         if args.extract_all:
             # Run all extractors
             results = {}
-            for extractor_class in [EcommerceExtractor, NewsExtractor, SocialMediaExtractor]:
-                extractor = extractor_class()
+            for extractor in BaseExtractor.registered_extractors():
                 if extractor.can_extract(soup, url):
                     extractor_name = extractor.__class__.__name__.replace('Extractor', '').lower()
-                    results[extractor_name] = extractor.extract(soup, url)
+                    results[extractor_name] = extractor.extract_cached(soup, url)
             
             if not results:
                 logger.warning(f"No suitable extractor found for {url}")
@@ -209,19 +203,15 @@ def extract_data(url: str, args: argparse.Namespace) -> Dict[str, Any]:
         else:
             # Use a single extractor
             if args.extractor == 'ecommerce':
-                extractor = EcommerceExtractor()
+                extractor = EcommerceExtractor.shared_instance()
             elif args.extractor == 'news':
-                extractor = NewsExtractor()
+                extractor = NewsExtractor.shared_instance()
             elif args.extractor == 'social':
-                extractor = SocialMediaExtractor()
+                extractor = SocialMediaExtractor.shared_instance()
             else:  # auto
-                # Try each extractor in turn
-                extractor = None
-                for extractor_class in [EcommerceExtractor, NewsExtractor, SocialMediaExtractor]:
-                    potential_extractor = extractor_class()
-                    if potential_extractor.can_extract(soup, url):
-                        extractor = potential_extractor
-                        break
+                # Try each registered extractor in turn, reusing instances
+                # across URLs
+                extractor = BaseExtractor.pick_extractor(soup, url)
                 
                 if not extractor:
                     logger.warning(f"No suitable extractor found for {url}")
@@ -232,7 +222,7 @@ def extract_data(url: str, args: argparse.Namespace) -> Dict[str, Any]:
                     }
             
             extractor_name = extractor.__class__.__name__.replace('Extractor', '').lower()
-            extracted_data = extractor.extract(soup, url)
+            extracted_data = extractor.extract_cached(soup, url)
             
             result = {
                 "url": url,
@@ -262,6 +252,9 @@ def crawl_and_extract(urls: List[str], args: argparse.Namespace) -> List[Dict[st
     Returns:
         List of extracted data
     """
+    from scraper_agent.core.crawler import Crawler
+    from scraper_agent.extractors import EcommerceExtractor, NewsExtractor, SocialMediaExtractor
+    
     # Configure crawler
     crawler = Crawler(
         start_urls=urls,
@@ -281,7 +274,7 @@ def crawl_and_extract(urls: List[str], args: argparse.Namespace) -> List[Dict[st
         def parser(soup, url):
             try:
                 if extractor.can_extract(soup, url):
-                    return extractor.extract(soup, url)
+                    return extractor.extract_cached(soup, url)
             except Exception as e:
                 logger.error(f"Error in extractor for {url}: {e}", exc_info=args.verbose)
             return {}
@@ -15,7 +15,7 @@ import time
 import random
 import logging
 import threading
-import requests
+import httpx
 from typing import List, Dict, Optional, Any, Tuple, Set
 from collections import defaultdict
 
@@ -116,16 +116,11 @@ class ProxyMiddleware:
         Returns:
             Tuple of (is_working, response_time)
         """
-        proxies = {
-            'http': proxy,
-            'https': proxy
-        }
-        
         start_time = time.time()
         try:
-            response = requests.get(
+            response = httpx.get(
                 self.test_url,
-                proxies=proxies,
+                proxy=proxy,
                 timeout=self.timeout,
                 headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'}
             )
@@ -11,6 +11,7 @@ with too many requests in a short time period. Supports:
 - Adaptive rate limiting based on server response
 """
 
+import asyncio
 import time
 import random
 import logging
@@ -71,12 +72,15 @@ class RateLimiter:
         
         logger.info(f"Rate limiter initialized with base delay of {base_delay}s")
     
-    def wait_for_rate_limit(self, domain: str) -> None:
+    def reserve_slot(self, domain: str) -> float:
         """
-        Wait an appropriate amount of time before making a request to a domain.
+        Book the next request slot for a domain without waiting for it.
         
         Args:
-            domain: Domain to wait for
+            domain: Domain the request will be sent to
+            
+        Returns:
+            Seconds the caller must wait before sending the request
         """
         with self.lock:
             current_time = time.time()
@@ -101,11 +105,33 @@ class RateLimiter:
             # Update the last request time before waiting
             self.last_request_time[domain] = current_time + wait_time
         
-        # Wait outside the lock to allow other threads to proceed
         if wait_time > 0:
             logger.debug(f"Rate limiting: waiting {wait_time:.2f}s for {domain}")
+        return wait_time
+    
+    def wait_for_rate_limit(self, domain: str) -> None:
+        """
+        Wait an appropriate amount of time before making a request to a domain.
+        
+        Args:
+            domain: Domain to wait for
+        """
+        # Wait outside the lock to allow other threads to proceed
+        wait_time = self.reserve_slot(domain)
+        if wait_time > 0:
             time.sleep(wait_time)
     
+    async def wait_for_rate_limit_async(self, domain: str) -> None:
+        """
+        Asynchronous version of wait_for_rate_limit for use inside an event loop.
+        
+        Args:
+            domain: Domain to wait for
+        """
+        wait_time = self.reserve_slot(domain)
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+    
     def _get_delay_for_domain(self, domain: str) -> float:
         """
         Get the appropriate delay for a domain based on rules and adaptive adjustments.
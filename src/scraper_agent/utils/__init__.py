@@ -41,6 +41,15 @@ from .browser_utils import (
     extract_page_metadata
 )
 
+from .html_utils import (
+    parse_html,
+    extract_links,
+    extract_tree_links,
+    has_fast_parser,
+    sniff_encoding,
+    scan_meta_tags
+)
+
 from .cache_manager import CacheManager
 
 __all__ = [
@@ -60,6 +69,10 @@ __all__ = [
     'take_full_page_screenshot', 'save_page_as_pdf', 'execute_js_on_page',
     'wait_for_navigation_idle', 'simulate_human_interaction', 'extract_page_metadata',
     
+    # HTML utilities
+    'parse_html', 'extract_links', 'extract_tree_links', 'has_fast_parser',
+    'sniff_encoding', 'scan_meta_tags',
+    
     # Cache manager
     'CacheManager'
 ] 
\ No newline at end of file
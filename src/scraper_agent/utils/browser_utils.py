@@ -15,17 +15,19 @@ import os
 import logging
 import random
 import json
-from typing import Dict, Optional, List, Any, Union, Tuple
+from typing import Dict, Optional, List, Any, Union, Tuple, TYPE_CHECKING
 from pathlib import Path
 
-from playwright.sync_api import (
-    sync_playwright, 
-    Browser, 
-    BrowserContext, 
-    Page, 
-    Playwright,
-    BrowserType
-)
+# Playwright ships in the optional "browser" extra, so it is only imported
+# for type checking here and loaded lazily through get_sync_api() at runtime.
+if TYPE_CHECKING:
+    from playwright.sync_api import (
+        Browser,
+        BrowserContext,
+        Page,
+        Playwright,
+        BrowserType
+    )
 
 # Configure logging
 logger = logging.getLogger('browser_utils')
@@ -33,8 +35,28 @@ logger = logging.getLogger('browser_utils')
 # Browser options
 BROWSER_TYPES = ['chromium', 'firefox', 'webkit']
 
+def get_sync_api() -> Any:
+    """
+    Import and return the Playwright sync API module.
+    
+    Returns:
+        The ``playwright.sync_api`` module
+        
+    Raises:
+        ImportError: If Playwright is not installed
+    """
+    try:
+        from playwright import sync_api
+    except ImportError as e:
+        raise ImportError(
+            "Playwright is required for browser automation. "
+            "Install it with: pip install 'scraper_agent[browser]' && playwright install"
+        ) from e
+    return sync_api
+
+
 def setup_browser_page(
-    playwright: Playwright,
+    playwright: 'Playwright',
     browser_type: str = 'chromium',
     headless: bool = True,
     user_agent: Optional[str] = None,
@@ -50,7 +72,7 @@ def setup_browser_page(
     user_data_dir: Optional[str] = None,
     slow_mo: int = 0,
     devtools: bool = False
-) -> Browser:
+) -> 'Browser':
     """
     Setup and configure a Playwright browser.
     
@@ -80,7 +102,7 @@ def setup_browser_page(
         browser_type = 'chromium'
     
     # Get browser launcher
-    browser_launcher: BrowserType = getattr(playwright, browser_type)
+    browser_launcher: 'BrowserType' = getattr(playwright, browser_type)
     
     # Prepare launch options
     launch_options = {
@@ -103,7 +125,7 @@ def setup_browser_page(
 
 
 def create_browser_context(
-    browser: Browser,
+    browser: 'Browser',
     user_agent: Optional[str] = None,
     proxy: Optional[Dict[str, str]] = None,
     viewport: Optional[Dict[str, int]] = None,
@@ -115,7 +137,7 @@ def create_browser_context(
     ignore_https_errors: bool = True,
     disable_javascript: bool = False,
     cookies: Optional[List[Dict[str, Any]]] = None
-) -> BrowserContext:
+) -> 'BrowserContext':
     """
     Create a browser context with the specified configuration.
     
@@ -172,7 +194,7 @@ def create_browser_context(
     return context
 
 
-def apply_stealth_mode(context: BrowserContext) -> None:
+def apply_stealth_mode(context: 'BrowserContext') -> None:
     """
     Apply various techniques to make the browser harder to detect as automated.
     
@@ -268,7 +290,7 @@ def apply_stealth_mode(context: BrowserContext) -> None:
     logger.debug("Applied stealth mode to browser context")
 
 
-def take_full_page_screenshot(page: Page, path: str, quality: int = 80) -> None:
+def take_full_page_screenshot(page: 'Page', path: str, quality: int = 80) -> None:
     """
     Take a full page screenshot and save it to the specified path.
     
@@ -285,7 +307,7 @@ def take_full_page_screenshot(page: Page, path: str, quality: int = 80) -> None:
     logger.debug(f"Saved full page screenshot to {path}")
 
 
-def save_page_as_pdf(page: Page, path: str, options: Optional[Dict[str, Any]] = None) -> None:
+def save_page_as_pdf(page: 'Page', path: str, options: Optional[Dict[str, Any]] = None) -> None:
     """
     Save the page as a PDF.
     
@@ -315,7 +337,7 @@ def save_page_as_pdf(page: Page, path: str, options: Optional[Dict[str, Any]] =
     logger.debug(f"Saved page as PDF to {path}")
 
 
-def execute_js_on_page(page: Page, script: str) -> Any:
+def execute_js_on_page(page: 'Page', script: str) -> Any:
     """
     Execute JavaScript code on the page and return the result.
     
@@ -329,7 +351,7 @@ def execute_js_on_page(page: Page, script: str) -> Any:
     return page.evaluate(script)
 
 
-def wait_for_navigation_idle(page: Page, timeout: int = 30000) -> None:
+def wait_for_navigation_idle(page: 'Page', timeout: int = 30000) -> None:
     """
     Wait for the page to become idle (no network activity).
     
@@ -341,7 +363,7 @@ def wait_for_navigation_idle(page: Page, timeout: int = 30000) -> None:
     logger.debug("Page navigation complete and idle")
 
 
-def simulate_human_interaction(page: Page) -> None:
+def simulate_human_interaction(page: 'Page') -> None:
     """
     Simulate human-like interaction with the page.
     
@@ -375,7 +397,7 @@ def simulate_human_interaction(page: Page) -> None:
     logger.debug("Simulated human-like interaction on page")
 
 
-def extract_page_metadata(page: Page) -> Dict[str, Any]:
+def extract_page_metadata(page: 'Page') -> Dict[str, Any]:
     """
     Extract useful metadata from the page.
     
@@ -14,14 +14,18 @@ import time
 import hashlib
 import pickle
 import logging
-from typing import Optional, Dict, Any, Union
+import queue
+import threading
+from typing import Optional, Dict, Any, List, Union
 from datetime import datetime, timedelta
-import requests
-from requests.models import Response
+from httpx import Response
 
 # Configure logging
 logger = logging.getLogger('cache_manager')
 
+# Maximum number of cache entries the flusher thread writes per batch
+WRITE_BATCH_SIZE = 128
+
 class CacheManager:
     """
     Manages caching of HTTP responses to prevent duplicate requests.
@@ -51,6 +55,12 @@ class CacheManager:
         # In-memory cache for faster access
         self.memory_cache: Dict[str, Dict[str, Any]] = {}
         
+        # Disk writes are queued and written in batches by a background
+        # thread, so caching a response never blocks on file I/O
+        self._write_queue: 'queue.Queue[Dict[str, Any]]' = queue.Queue()
+        self._flusher: Optional[threading.Thread] = None
+        self._flusher_lock = threading.Lock()
+        
         # Ensure cache directory exists
         if enabled and cache_dir:
             os.makedirs(cache_dir, exist_ok=True)
@@ -169,14 +179,69 @@ class CacheManager:
         self.memory_cache[cache_key] = cache_entry
         self._manage_cache_size()
         
-        # Save to disk cache
-        cache_file = self._get_cache_file_path(cache_key)
-        try:
-            with open(cache_file, 'wb') as f:
-                pickle.dump(cache_entry, f)
-            logger.debug(f"Cached response for: {url}")
-        except Exception as e:
-            logger.warning(f"Error caching response for {url}: {e}")
+        # Queue the disk write for the flusher thread
+        self._start_flusher()
+        self._write_queue.put(cache_entry)
+    
+    def flush(self) -> None:
+        """
+        Block until every queued cache entry has been written to disk.
+        """
+        self._write_queue.join()
+    
+    def _start_flusher(self) -> None:
+        """
+        Start the background thread writing cache entries to disk, if not running.
+        """
+        if self._flusher is not None:
+            return
+        
+        with self._flusher_lock:
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=self._flush_writes, name='cache-flusher', daemon=True)
+                self._flusher.start()
+    
+    def _flush_writes(self) -> None:
+        """
+        Write queued cache entries to disk, draining whatever has accumulated
+        (up to WRITE_BATCH_SIZE entries) on each wake-up.
+        """
+        while True:
+            batch = [self._write_queue.get()]
+            while len(batch) < WRITE_BATCH_SIZE:
+                try:
+                    batch.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                self._write_entries(batch)
+            finally:
+                for _ in batch:
+                    self._write_queue.task_done()
+    
+    def _write_entries(self, entries: List[Dict[str, Any]]) -> None:
+        """
+        Save cache entries to disk.
+        
+        Each entry is written to a temporary file and renamed into place, so
+        readers never see a partially written cache file.
+        
+        Args:
+            entries: Cache entries to save
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        for cache_entry in entries:
+            url = cache_entry['url']
+            cache_file = self._get_cache_file_path(self._get_cache_key(url))
+            temp_file = f"{cache_file}.tmp"
+            try:
+                with open(temp_file, 'wb') as f:
+                    pickle.dump(cache_entry, f)
+                os.replace(temp_file, cache_file)
+                logger.debug(f"Cached response for: {url}")
+            except Exception as e:
+                logger.warning(f"Error caching response for {url}: {e}")
     
     def _manage_cache_size(self) -> None:
         """
@@ -200,6 +265,9 @@ class CacheManager:
         """
         Clear all cached responses from both memory and disk.
         """
+        # Let pending writes land first so they are cleared too
+        self.flush()
+        
         # Clear memory cache
         self.memory_cache.clear()
         
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+HTML Utilities Module
+
+Provides helpers that work directly on raw HTML instead of a BeautifulSoup tree:
+- Robust lxml parsing of fetched documents
+- Charset detection from <meta> declarations
+- Meta tag extraction by scanning the markup, without building a tree
+- Link extraction using selectolax when the "fast-html" extra is installed
+- lxml-based fallback with the same results
+"""
+
+import codecs
+import html as html_lib
+import logging
+import re
+import urllib.parse
+from typing import Dict, List, Optional, Tuple, Union
+
+import lxml.html
+from lxml import etree
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # Optional "fast-html" extra
+    LexborHTMLParser = None
+
+from .url_utils import normalize_url
+
+# Configure logging
+logger = logging.getLogger('html_utils')
+
+# Link schemes that never point at crawlable pages
+SKIPPED_LINK_PREFIXES = ('javascript:', 'mailto:', 'tel:')
+
+_XP_BASE_HREF = etree.XPath('//base/@href')
+_XP_LINK_HREFS = etree.XPath('//a/@href | //area/@href')
+
+_UTF8_HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+
+# Matches both <meta charset="..."> and the http-equiv Content-Type form
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([a-z0-9_.:-]+)', re.IGNORECASE)
+
+# Number of leading bytes searched for a <meta> charset declaration
+CHARSET_SNIFF_BYTES = 1024
+
+# A whole <meta> tag, allowing '>' inside quoted attribute values
+_META_TAG_RE = re.compile(r'<meta\b((?:[^>"\']|"[^"]*"|\'[^\']*\')*)>', re.IGNORECASE)
+
+# One attribute of a tag: name, then a double-quoted, single-quoted or bare value
+_TAG_ATTR_RE = re.compile(r'([^\s"\'>/=]+)(?:\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'=<>`]+)))?')
+
+
+def has_fast_parser() -> bool:
+    """
+    Check whether the selectolax parser from the "fast-html" extra is available.
+
+    Returns:
+        True if selectolax can be used
+    """
+    return LexborHTMLParser is not None
+
+
+def parse_html(html: Union[str, bytes]) -> lxml.html.HtmlElement:
+    """
+    Parse an HTML document with lxml.
+
+    Args:
+        html: Raw HTML as text or bytes
+
+    Returns:
+        Root element of the document, or an empty <html> element if there is
+        nothing to parse
+    """
+    try:
+        return lxml.html.document_fromstring(html)
+    except ValueError:
+        # lxml rejects text that carries an XML encoding declaration
+        if isinstance(html, str):
+            return lxml.html.document_fromstring(html.encode('utf-8'), parser=_UTF8_HTML_PARSER)
+        raise
+    except etree.ParserError:
+        # Empty or whitespace-only document
+        return lxml.html.Element('html')
+
+
+def sniff_encoding(content: bytes) -> str:
+    """
+    Determine the encoding of an HTML document served without a charset.
+
+    Looks for a byte order mark, then a <meta> charset declaration near the
+    start of the document, following the HTML standard's overrides (a
+    declared UTF-16 means UTF-8, Latin-1 and ASCII mean windows-1252).
+    Suitable as httpx's default_encoding callback.
+
+    Args:
+        content: Raw response body
+
+    Returns:
+        Codec name, UTF-8 if nothing is declared
+    """
+    if content.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    if content.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return 'utf-16'
+
+    match = _META_CHARSET_RE.search(content, 0, CHARSET_SNIFF_BYTES)
+    if match:
+        try:
+            name = codecs.lookup(match.group(1).decode('ascii')).name
+        except LookupError:
+            return 'utf-8'
+        if name.startswith('utf-16'):
+            return 'utf-8'
+        if name in ('latin-1', 'iso8859-1', 'ascii'):
+            return 'cp1252'
+        return name
+
+    return 'utf-8'
+
+
+def scan_meta_tags(html: Union[str, bytes]) -> Dict[str, str]:
+    """
+    Extract meta tags by scanning raw HTML, without parsing it into a tree.
+
+    Gives the same name/property to content mapping as
+    BaseExtractor.extract_meta_tags for ordinary pages at a fraction of the
+    cost. Being a scan rather than a parse, it also picks up <meta> markup
+    inside comments and scripts.
+
+    Args:
+        html: Raw HTML as text or bytes; bytes are decoded with sniff_encoding
+
+    Returns:
+        Dictionary of meta tag name (or else property) to content
+    """
+    if isinstance(html, bytes):
+        html = html.decode(sniff_encoding(html), errors='replace')
+
+    meta_tags: Dict[str, str] = {}
+    for tag in _META_TAG_RE.finditer(html):
+        attrs: Dict[str, str] = {}
+        for name, double_quoted, single_quoted, bare in _TAG_ATTR_RE.findall(tag.group(1)):
+            # As in HTML parsers, names are case-insensitive and the first occurrence wins
+            attrs.setdefault(name.lower(), double_quoted or single_quoted or bare)
+
+        content = attrs.get('content')
+        if content is None:
+            continue
+        key = attrs.get('name') or attrs.get('property')
+        if key:
+            meta_tags[html_lib.unescape(key)] = html_lib.unescape(content)
+
+    return meta_tags
+
+
+def _raw_links_selectolax(html: Union[str, bytes]) -> Tuple[Optional[str], List[str]]:
+    tree = LexborHTMLParser(html)
+    base = tree.css_first('base[href]')
+    base_href = base.attributes.get('href') if base is not None else None
+    hrefs = [node.attributes.get('href') for node in tree.css('a[href], area[href]')]
+    return base_href, hrefs
+
+
+def _raw_links_lxml(tree: lxml.html.HtmlElement) -> Tuple[Optional[str], List[str]]:
+    base_hrefs = _XP_BASE_HREF(tree)
+    return (base_hrefs[0] if base_hrefs else None), [str(href) for href in _XP_LINK_HREFS(tree)]
+
+
+def _resolve_links(base_href: Optional[str], hrefs: List[str], base_url: str) -> List[str]:
+    if base_href:
+        base_url = urllib.parse.urljoin(base_url, base_href)
+
+    links = []
+    for href in hrefs:
+        if href and not href.startswith(SKIPPED_LINK_PREFIXES):
+            links.append(normalize_url(urllib.parse.urljoin(base_url, href)))
+
+    return links
+
+
+def extract_links(html: Union[str, bytes], base_url: str) -> List[str]:
+    """
+    Extract absolute, normalized link URLs from raw HTML.
+
+    Links are taken from <a> and <area> tags and resolved against the page's
+    <base href> if present. javascript:, mailto: and tel: links are skipped.
+
+    Args:
+        html: Raw HTML as text or bytes
+        base_url: URL of the page, used to resolve relative links
+
+    Returns:
+        List of normalized URLs in document order
+    """
+    if LexborHTMLParser is not None:
+        base_href, hrefs = _raw_links_selectolax(html)
+    else:
+        base_href, hrefs = _raw_links_lxml(parse_html(html))
+
+    return _resolve_links(base_href, hrefs, base_url)
+
+
+def extract_tree_links(tree: lxml.html.HtmlElement, base_url: str) -> List[str]:
+    """
+    Extract absolute, normalized link URLs from an already parsed lxml document.
+
+    Same rules as extract_links, for callers that have parsed the page anyway.
+
+    Args:
+        tree: Root element returned by parse_html
+        base_url: URL of the page, used to resolve relative links
+
+    Returns:
+        List of normalized URLs in document order
+    """
+    return _resolve_links(*_raw_links_lxml(tree), base_url)
@@ -15,8 +15,7 @@ import random
 import time
 from typing import Dict, Optional, List, Tuple, Union
 import logging
-import requests
-from requests.models import Response
+from httpx import Response
 
 # Configure logging
 logger = logging.getLogger('http_utils')
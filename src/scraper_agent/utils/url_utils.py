@@ -13,6 +13,7 @@ Provides utilities for manipulating and validating URLs:
 
 import re
 import urllib.parse
+from functools import lru_cache
 from typing import Optional, Tuple, List
 from urllib.parse import urlparse, urlunparse, ParseResult, parse_qs, urlencode
 
@@ -66,10 +67,14 @@ def normalize_url(url: str) -> str:
     return normalized
 
 
+@lru_cache(maxsize=65536)
 def get_domain(url: str) -> str:
     """
     Extract the domain from a URL.
     
+    Results are cached, since the crawler looks up the same URLs repeatedly
+    for domain filters, robots.txt and statistics.
+    
     Args:
         url: URL to extract domain from
         
@@ -3,8 +3,8 @@ Basic tests for ScraperAgent.
 """
 
 import unittest
-from src.core.crawler import Crawler
-from src.extractors.base_extractor import BaseExtractor
+from scraper_agent.core.crawler import Crawler
+from scraper_agent.extractors.base_extractor import BaseExtractor
 
 class TestBasic(unittest.TestCase):
     """Basic test cases."""
@@ -0,0 +1,31 @@
+"""
+Tests for the HTTP response cache.
+"""
+
+import tempfile
+import unittest
+
+import httpx
+
+from scraper_agent.utils.cache_manager import CacheManager
+
+
+class TestCacheManager(unittest.TestCase):
+    """Test cases for CacheManager."""
+
+    def test_cached_response_is_written_to_disk(self):
+        """Test cached responses are served from memory and, once flushed, from disk."""
+        cache_dir = tempfile.mkdtemp()
+        url = 'https://example.com/'
+        cache = CacheManager(cache_dir=cache_dir)
+        cache.cache_response(url, httpx.Response(200, text='cached'))
+        self.assertEqual(cache.get_response(url).text, 'cached')
+
+        cache.flush()
+        reloaded = CacheManager(cache_dir=cache_dir)
+        self.assertEqual(reloaded.get_response(url).text, 'cached')
+        self.assertEqual(reloaded.get_cache_stats()['disk_entries'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
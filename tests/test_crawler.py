@@ -0,0 +1,168 @@
+"""
+Tests for the crawler's HTTP crawl loop.
+"""
+
+import functools
+import tempfile
+import unittest
+from unittest import mock
+
+import httpx
+
+from scraper_agent.core.crawler import Crawler
+
+PAGES = {
+    '/': '<html><head><title>Home</title></head><body>'
+         '<a href="/a">A</a><a href="/b">B</a><a href="/private/x">X</a><a href="/doc.pdf">PDF</a>'
+         '</body></html>',
+    '/a': '<html><head><title>A</title></head><body>'
+          '<a href="/c">C</a><a href="/">Home</a></body></html>',
+    '/b': '<html><head><title>B</title></head><body><p>b</p></body></html>',
+    '/c': '<html><head><title>C</title></head><body><p>c</p></body></html>',
+    '/new/dir/page': '<html><head><title>New</title></head><body>'
+                     '<a href="child">Child</a></body></html>',
+}
+
+
+def handle(request: httpx.Request) -> httpx.Response:
+    path = request.url.path
+    if path == '/robots.txt':
+        return httpx.Response(200, text='User-agent: *\nDisallow: /private\n')
+    if path == '/older/start':
+        return httpx.Response(302, headers={'location': '../old'})
+    if path == '/old':
+        return httpx.Response(301, headers={'location': '/new/dir/page'})
+    if path == '/doc.pdf':
+        return httpx.Response(200, content=b'%PDF', headers={'content-type': 'application/pdf'})
+    if path in PAGES:
+        return httpx.Response(200, html=PAGES[path])
+    return httpx.Response(404)
+
+
+class TestCrawl(unittest.TestCase):
+    """Test cases for Crawler.crawl over HTTP."""
+
+    def setUp(self):
+        transport = httpx.MockTransport(handle)
+        for name in ('Client', 'AsyncClient'):
+            patcher = mock.patch.object(
+                httpx, name, functools.partial(getattr(httpx, name), transport=transport)
+            )
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _crawl(self, start_url='https://example.com/', **kwargs):
+        crawler = Crawler(
+            start_urls=[start_url],
+            output_dir=tempfile.mkdtemp(),
+            delay=0,
+            cache_enabled=False,
+            **kwargs
+        )
+        crawler.rate_limiter.min_delay = crawler.rate_limiter.base_delay = 0
+        return crawler, crawler.crawl()
+
+    def test_crawl_follows_links(self):
+        """Test pages are crawled once each, honouring depth and robots.txt."""
+        crawler, results = self._crawl(max_depth=2, max_workers=3)
+        by_url = {result['url']: result for result in results}
+
+        self.assertEqual(sorted(by_url), [
+            'https://example.com/',
+            'https://example.com/a',
+            'https://example.com/b',
+            'https://example.com/c',
+            'https://example.com/doc.pdf',
+        ])
+        self.assertEqual(by_url['https://example.com/a']['title'], 'A')
+        self.assertEqual(by_url['https://example.com/c']['depth'], 2)
+        self.assertEqual(by_url['https://example.com/doc.pdf']['status'], 'error')
+        self.assertEqual(crawler.pages_crawled, 4)
+
+    def test_crawl_with_parse_workers(self):
+        """Test pages parsed in worker processes give the same results."""
+        _, results = self._crawl(max_depth=2, parse_workers=1)
+        titles = {result['url']: result.get('title') for result in results}
+        self.assertEqual(titles['https://example.com/c'], 'C')
+        self.assertEqual(len(results), 5)
+
+    def test_crawl_respects_max_pages(self):
+        """Test the crawl stops once max_pages pages have been processed."""
+        crawler, results = self._crawl(max_depth=2, max_workers=1, max_pages=2)
+        self.assertEqual(crawler.pages_crawled, 2)
+        self.assertEqual(len(results), 2)
+
+    def test_manual_redirect_resolves_links_against_target(self):
+        """Test relative links on a redirected page resolve against the redirect target."""
+        _, results = self._crawl(
+            start_url='https://example.com/old', max_depth=0, follow_redirects=False
+        )
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]['title'], 'New')
+        self.assertEqual(results[0]['links'], ['https://example.com/new/dir/child'])
+
+    def test_manual_redirect_chain(self):
+        """Test each relative Location resolves against the previous hop, links against the last."""
+        _, results = self._crawl(
+            start_url='https://example.com/older/start', max_depth=0, follow_redirects=False
+        )
+        self.assertEqual(results[0]['links'], ['https://example.com/new/dir/child'])
+
+    def test_duplicate_content_is_skipped(self):
+        """Test a page repeating earlier content is recorded as a duplicate."""
+        crawler = Crawler(
+            start_urls=['https://example.com/'],
+            output_dir=tempfile.mkdtemp(),
+            skip_duplicate_content=True
+        )
+        self.assertIsNone(crawler._duplicate_result('https://example.com/b', 1, PAGES['/b']))
+        self.assertIsNone(crawler._duplicate_result('https://example.com/b', 1, PAGES['/b']))
+        duplicate = crawler._duplicate_result('https://example.com/b?copy=1', 1, PAGES['/b'])
+        self.assertEqual(duplicate['status'], 'duplicate')
+        self.assertEqual(duplicate['duplicate_of'], 'https://example.com/b')
+
+
+class TestRobots(unittest.TestCase):
+    """Test cases for robots.txt handling."""
+
+    def test_robots_status_codes(self):
+        """Test missing robots.txt allows everything and forbidden robots.txt blocks everything."""
+        crawler = Crawler(start_urls=['https://example.com/'], output_dir=tempfile.mkdtemp())
+        robots_url = 'https://example.com/robots.txt'
+        for status, allowed in ((404, True), (403, False), (None, True)):
+            response = httpx.Response(status) if status else None
+            parser = crawler._build_robots_parser('example.com', robots_url, response)
+            self.assertEqual(
+                parser.can_fetch(crawler.robots_user_agent, 'https://example.com/a'), allowed
+            )
+
+
+class TestDefaultParser(unittest.TestCase):
+    """Test cases for the default page parser."""
+
+    def test_default_parser(self):
+        """Test metadata, text, headers and links are extracted."""
+        html = (
+            '<html><head><title> Page </title>'
+            '<meta name="description" content="About">'
+            '<link rel="alternate canonical" href="https://example.com/page"></head>'
+            '<body><h1>Main <em>title</em></h1><h2>Sub</h2>'
+            '<p>First</p><p> </p><div><p>Second</p></div>'
+            '<a href="/next">Next</a><a href="javascript:void(0)">JS</a></body></html>'
+        )
+        crawler = Crawler(start_urls=['https://example.com/'], output_dir=tempfile.mkdtemp())
+        result = crawler._default_parser(html, 'https://example.com/page?ref=1')
+
+        self.assertEqual(result['title'], 'Page')
+        self.assertEqual(result['description'], 'About')
+        self.assertEqual(result['keywords'], 'No keywords found')
+        self.assertEqual(result['canonical_url'], 'https://example.com/page')
+        self.assertEqual(result['text_content'], 'First\nSecond')
+        self.assertEqual(result['headers']['h1'], ['Main title'])
+        self.assertEqual(result['headers']['h2'], ['Sub'])
+        self.assertEqual(result['links'], ['https://example.com/next'])
+        self.assertEqual(result['page_size_bytes'], len(html))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,289 @@
+"""
+Tests for the shared extractor helpers.
+"""
+
+import json
+import unittest
+from unittest import mock
+
+from bs4 import BeautifulSoup
+
+from scraper_agent.extractors import BaseExtractor, EcommerceExtractor, NewsExtractor
+
+PAGE = (
+    '<html><head><meta name="description" content="About">'
+    '<meta property="og:type" content="article"><meta charset="utf-8">'
+    '<script type="application/ld+json">{"@type": "NewsArticle"}</script>'
+    '<script type="application/ld+json">not json</script></head>'
+    '<body><div class="content"><p>Too short</p></div>'
+    '<article><p>A paragraph that is long enough to count as a text block.</p></article>'
+    '</body></html>'
+)
+
+PRODUCT_PAGE = (
+    '<html><body><h1 class="product-title">Shoe<script>track()</script></h1>'
+    '<span class="price" data-price="12.50">$12.50</span>'
+    '<label>Size</label><select name="option_size"><option value="">Choose</option>'
+    '<option value="s">Small</option><option value="m">Medium</option></select>'
+    '<table class="data-table"><tr><th>Weight</th><td> 1 kg </td></tr></table>'
+    '<main><p>First paragraph.</p><p>Second.</p></main></body></html>'
+)
+
+ARTICLE_PAGE = (
+    '<html><body><h1>Council approves the new budget</h1>'
+    '<div class="byline">By Jane Doe and John Roe</div>'
+    '<time datetime="2021-03-04T05:06:07">March 4</time>'
+    '<article><p>The council voted on Tuesday to approve the budget.<script>track()</script></p>'
+    '<ul class="share-links"><li>Share this article on social media</li></ul>'
+    '<p>Short.</p></article>'
+    '<div class="related-articles"><div class="item"><a href="/other">Other story</a>'
+    '<p>An excerpt of the other story.</p></div></div></body></html>'
+)
+
+
+class TestBaseExtractorHelpers(unittest.TestCase):
+    """Test cases for BaseExtractor helper methods."""
+
+    def setUp(self):
+        self.soup = BeautifulSoup(PAGE, 'lxml')
+        self.extractor = NewsExtractor()
+
+    def test_meta_tags_and_structured_data(self):
+        """Test meta tags and JSON-LD are collected, and results are safe to modify."""
+        meta_tags = self.extractor.extract_meta_tags(self.soup)
+        self.assertEqual(meta_tags, {'description': 'About', 'og:type': 'article'})
+        meta_tags.clear()
+        self.assertEqual(len(self.extractor.extract_meta_tags(self.soup)), 2)
+        structured_data = self.extractor.extract_structured_data(self.soup)
+        self.assertEqual(structured_data, [{'@type': 'NewsArticle'}])
+
+    def test_main_content_prefers_earlier_selectors(self):
+        """Test <article> wins over an earlier .content container."""
+        self.assertEqual(self.extractor.get_main_content(self.soup).name, 'article')
+        self.assertEqual(
+            self.extractor.get_text_blocks(self.soup),
+            ['A paragraph that is long enough to count as a text block.']
+        )
+
+    def test_from_html_keeps_required_tags(self):
+        """Test from_html parses only REQUIRED_TAGS, or the whole page when unset."""
+        class MetaExtractor(BaseExtractor, register=False):
+            REQUIRED_TAGS = frozenset({'meta'})
+
+            def extract(self, soup, url):
+                return self.extract_meta_tags(soup)
+
+            def can_extract(self, soup, url):
+                return True
+
+        soup = MetaExtractor.from_html(PAGE)
+        self.assertIsNone(soup.find('article'))
+        meta_tags = MetaExtractor().extract(soup, 'https://example.com/')
+        self.assertEqual(meta_tags['description'], 'About')
+        self.assertIsNotNone(NewsExtractor.from_html(PAGE).find('article'))
+
+    def test_from_html_keeps_main_content(self):
+        """Test get_main_content finds div and section containers on a from_html soup."""
+        class MainContentExtractor(BaseExtractor, register=False):
+            def extract(self, soup, url):
+                return {'text_blocks': self.get_text_blocks(soup)}
+
+            def can_extract(self, soup, url):
+                return True
+
+        extractor = MainContentExtractor()
+        for container in ('<div class="content">', '<div id="main">', '<section role="main">'):
+            html = (
+                '<html><body><span>Menu</span>' + container
+                + '<p>A paragraph that is long enough to count as a text block.</p>'
+                + '</' + container[1:container.index(' ')] + '></body></html>'
+            )
+            soup = MainContentExtractor.from_html(html)
+            expected = BeautifulSoup(html, 'lxml').find(['div', 'section'])
+            self.assertEqual(str(extractor.get_main_content(soup)), str(expected))
+            self.assertEqual(
+                extractor.extract(soup, 'https://example.com/'),
+                {'text_blocks': ['A paragraph that is long enough to count as a text block.']}
+            )
+
+    def test_parse_head_only(self):
+        """Test head metadata is read from raw HTML and body tags are ignored."""
+        head = BaseExtractor.parse_head_only(
+            PAGE.replace('<head>', '<head><title> Title </title>')
+                .replace('<body>', '<body><meta name="late" content="x">').encode('utf-8')
+        )
+        self.assertEqual(head['title'], 'Title')
+        self.assertIsNone(head['canonical_url'])
+        self.assertEqual(head['meta_tags'], {'description': 'About', 'og:type': 'article'})
+        self.assertEqual(head['structured_data'], [{'@type': 'NewsArticle'}])
+
+    def test_extract_batch(self):
+        """Test pages extracted in worker processes match in-process extraction."""
+        pages = [
+            (PAGE, 'https://example.com/news/1'),
+            ('<p>Nothing</p>', 'https://example.com/about')
+        ]
+        expected = [self.extractor.extract(self.soup, pages[0][1]), {}]
+        self.assertEqual(self.extractor.extract_batch(pages, workers=1), expected)
+        self.assertEqual(self.extractor.extract_batch(pages, workers=2), expected)
+
+    def test_extract_batch_parses_whole_page_by_default(self):
+        """Test extract_batch only strains pages for classes that set their own REQUIRED_TAGS."""
+        class TitleExtractor(BaseExtractor, register=False):
+            def extract(self, soup, url):
+                title = soup.title.string if soup.title else None
+                return {'title': title, 'links': len(soup.find_all('a'))}
+
+            def can_extract(self, soup, url):
+                return True
+
+        class StrainedTitleExtractor(TitleExtractor, register=False):
+            REQUIRED_TAGS = frozenset({'title'})
+
+        html = '<html><head><title>T</title></head><body><a href="/x">X</a></body></html>'
+        pages = [(html, 'https://example.com/')]
+        self.assertEqual(
+            TitleExtractor().extract_batch(pages, workers=1), [{'title': 'T', 'links': 1}]
+        )
+        self.assertEqual(
+            StrainedTitleExtractor().extract_batch(pages, workers=1), [{'title': 'T', 'links': 0}]
+        )
+
+    def test_pick_extractor(self):
+        """Test the bundled extractors are registered in order and picked by can_extract."""
+        names = [type(extractor).__name__ for extractor in BaseExtractor.registered_extractors()]
+        self.assertEqual(names, ['EcommerceExtractor', 'NewsExtractor', 'SocialMediaExtractor'])
+        picked = BaseExtractor.pick_extractor(self.soup, 'https://example.com/news/1')
+        self.assertIsInstance(picked, NewsExtractor)
+
+    def test_abstract_subclasses_are_not_picked(self):
+        """Test an abstract helper base in the registry is skipped rather than instantiated."""
+        with mock.patch.object(BaseExtractor, '_registry', list(BaseExtractor._registry)):
+            class HelperBase(BaseExtractor):
+                def helper(self):
+                    return None
+
+            self.assertIn(HelperBase, BaseExtractor._registry)
+            extractors = BaseExtractor.registered_extractors()
+            names = [type(extractor).__name__ for extractor in extractors]
+            self.assertEqual(names, ['EcommerceExtractor', 'NewsExtractor', 'SocialMediaExtractor'])
+            self.assertIsInstance(
+                BaseExtractor.pick_extractor(self.soup, 'https://example.com/news/1'), NewsExtractor
+            )
+
+    def test_extract_cached(self):
+        """Test repeated URLs reuse the cached result and the oldest entry is evicted."""
+        extractor = NewsExtractor({'cache_ignore_query': True})
+        extractor.RESULT_CACHE_SIZE = 1
+        with mock.patch.object(extractor, 'extract', return_value={'title': 'A'}) as extract:
+            extractor.extract_cached(self.soup, 'https://example.com/news/1?page=1')
+            result = extractor.extract_cached(self.soup, 'https://Example.com/news/1?page=2')
+            self.assertEqual(result, {'title': 'A'})
+            self.assertEqual(extract.call_count, 1)
+            extractor.extract_cached(self.soup, 'https://example.com/news/2')
+            extractor.extract_cached(self.soup, 'https://example.com/news/1')
+            self.assertEqual(extract.call_count, 3)
+
+    def test_extract_cached_returns_copies(self):
+        """Test changes to a returned result, nested values included, do not reach the cache."""
+        extractor = NewsExtractor()
+        url = 'https://example.com/news/1'
+        result = {'extracted_data': {'tags': ['a']}}
+        with mock.patch.object(extractor, 'extract', return_value=result):
+            extractor.extract_cached(self.soup, url)['extracted_data']['tags'].append('b')
+            cached = extractor.extract_cached(self.soup, url)
+            self.assertEqual(cached, {'extracted_data': {'tags': ['a']}})
+
+
+class TestEcommerceExtractor(unittest.TestCase):
+    """Test cases for EcommerceExtractor HTML extraction."""
+
+    def test_extract_from_html(self):
+        """Test name, price, description, variants and specifications are read from markup."""
+        extractor = EcommerceExtractor()
+        soup = BeautifulSoup(PRODUCT_PAGE, 'lxml')
+        data = extractor.extract(soup, 'https://shop.example.com/p/1')['extracted_data']
+
+        self.assertEqual(data['name'], 'Shoe')
+        self.assertEqual(data['price'], '12.50')
+        self.assertEqual(data['description'], 'First paragraph.\nSecond.')
+        self.assertEqual(data['variants'], [{'name': 'Size', 'values': ['Small', 'Medium']}])
+        self.assertEqual(data['specifications'], {'Weight': '1 kg'})
+
+    def test_prefer_structured_data(self):
+        """Test JSON-LD additionalProperty replaces the HTML specifications when preferred."""
+        page = PRODUCT_PAGE.replace('<html>', (
+            '<html><head><script type="application/ld+json">{"@type": "Product", "name": "Shoe",'
+            ' "additionalProperty": [{"@type": "PropertyValue",'
+            ' "name": "Material", "value": "Leather"}]}'
+            '</script></head>'
+        ))
+        url = 'https://shop.example.com/p/1'
+
+        data = EcommerceExtractor().extract(BeautifulSoup(page, 'lxml'), url)['extracted_data']
+        self.assertEqual(data['specifications'], {'Weight': '1 kg'})
+
+        extractor = EcommerceExtractor({'prefer_structured_data': True})
+        with mock.patch.object(extractor, '_extract_specifications') as extract_specifications:
+            data = extractor.extract(BeautifulSoup(page, 'lxml'), url)['extracted_data']
+        extract_specifications.assert_not_called()
+        self.assertEqual(data['specifications'], {'Material': 'Leather'})
+        self.assertEqual(data['variants'], [{'name': 'Size', 'values': ['Small', 'Medium']}])
+
+
+class TestNewsExtractor(unittest.TestCase):
+    """Test cases for NewsExtractor HTML extraction."""
+
+    def test_extract_from_html(self):
+        """Test headline, authors, date, content and related articles are read from markup."""
+        extractor = NewsExtractor()
+        soup = BeautifulSoup(ARTICLE_PAGE, 'lxml')
+        data = extractor.extract(soup, 'https://news.example.com/a/1')['extracted_data']
+
+        self.assertEqual(data['headline'], 'Council approves the new budget')
+        self.assertEqual(data['authors'], ['Jane Doe', 'John Roe'])
+        self.assertEqual(data['date_published_formatted'], '2021-03-04 05:06:07')
+        self.assertEqual(data['content'], 'The council voted on Tuesday to approve the budget.')
+        self.assertEqual(data['related_articles'], [{
+            'title': 'Other story',
+            'url': 'https://news.example.com/other',
+            'excerpt': 'An excerpt of the other story.'
+        }])
+
+    def test_article_content_reading_order(self):
+        """Test content blocks come out in document order, each list item once."""
+        html = (
+            '<html><body><article><h2>The background to the vote</h2>'
+            '<p>The first paragraph of the article body.</p>'
+            '<ul><li>A point made in the bulleted list'
+            '<ul><li>A nested point in the list</li></ul></li></ul>'
+            '<blockquote>A quotation from the council meeting</blockquote>'
+            '<h3>What happens next, in brief</h3></article></body></html>'
+        )
+        content = NewsExtractor()._extract_article_content(BeautifulSoup(html, 'lxml'))
+        self.assertEqual(content.split('\n\n'), [
+            'The background to the vote',
+            'The first paragraph of the article body.',
+            '• A point made in the bulleted listA nested point in the list',
+            '• A nested point in the list',
+            '"A quotation from the council meeting"',
+            'What happens next, in brief'
+        ])
+
+    def test_non_string_date_published(self):
+        """Test JSON-LD datePublished values that are not strings are kept but not parsed."""
+        for value in (['2024-01-02'], 20240102):
+            html = (
+                '<html><head><script type="application/ld+json">'
+                + json.dumps({'@type': 'NewsArticle', 'headline': 'H', 'datePublished': value})
+                + '</script></head><body></body></html>'
+            )
+            soup = BeautifulSoup(html, 'lxml')
+            data = NewsExtractor().extract(soup, 'https://news.example.com/a/1')['extracted_data']
+            self.assertEqual(data['headline'], 'H')
+            self.assertEqual(data['date_published'], value)
+            self.assertNotIn('date_published_formatted', data)
+
+
+if __name__ == '__main__':
+    unittest.main()
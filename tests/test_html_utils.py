@@ -0,0 +1,73 @@
+"""
+Tests for the raw-HTML helpers.
+"""
+
+import unittest
+from unittest import mock
+
+from scraper_agent.utils import html_utils
+
+PAGE = (
+    '<html><head><base href="https://cdn.example.com/docs/"></head><body>'
+    '<a href="intro">Intro</a>'
+    '<a href="mailto:team@example.com">Mail</a>'
+    '<area href="/map?b=2&a=1">'
+    '<a>No href</a>'
+    '</body></html>'
+)
+
+EXPECTED = [
+    'https://cdn.example.com/docs/intro',
+    'https://cdn.example.com/map?a=1&b=2',
+]
+
+
+class TestExtractLinks(unittest.TestCase):
+    """Test cases for extract_links."""
+
+    def test_extract_links(self):
+        """Test links are resolved against <base> and normalized."""
+        self.assertEqual(html_utils.extract_links(PAGE, 'https://example.com/'), EXPECTED)
+
+    def test_extract_links_lxml_fallback(self):
+        """Test the lxml fallback gives the same result as selectolax."""
+        with mock.patch.object(html_utils, 'LexborHTMLParser', None):
+            self.assertEqual(html_utils.extract_links(PAGE, 'https://example.com/'), EXPECTED)
+            self.assertEqual(html_utils.extract_links('', 'https://example.com/'), [])
+
+
+class TestSniffEncoding(unittest.TestCase):
+    """Test cases for sniff_encoding."""
+
+    def test_sniff_encoding(self):
+        """Test meta declarations are honoured and UTF-8 is the default."""
+        self.assertEqual(html_utils.sniff_encoding(b'<html><p>caf\xc3\xa9</p>'), 'utf-8')
+        self.assertEqual(
+            html_utils.sniff_encoding(b'<meta charset="ISO-8859-1"><p>caf\xe9</p>'), 'cp1252'
+        )
+        self.assertEqual(
+            html_utils.sniff_encoding(
+                b'<meta http-equiv="Content-Type" content="text/html; charset=koi8-r">'
+            ),
+            'koi8-r'
+        )
+        self.assertEqual(html_utils.sniff_encoding(b'<meta charset="bogus">'), 'utf-8')
+
+
+class TestScanMetaTags(unittest.TestCase):
+    """Test cases for scan_meta_tags."""
+
+    def test_scan_meta_tags(self):
+        """Test quoting, case, entities and the name/property fallback."""
+        html = (
+            '<meta charset="utf-8"><meta name="description" content="a > b">'
+            "<META Property='og:title' CONTENT='Fish &amp; chips'>"
+            '<meta name="" property="og:type" content=article><meta name="robots">'
+        )
+        expected = {'description': 'a > b', 'og:title': 'Fish & chips', 'og:type': 'article'}
+        self.assertEqual(html_utils.scan_meta_tags(html), expected)
+        self.assertEqual(html_utils.scan_meta_tags(html.encode('utf-8')), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()